@@ -34,6 +34,14 @@ def create_app():
         maxPoolSize=20
     )
     app.db = mongo_client[app.config['MONGO_DB']]
+
+    from db_indexes import apply_indexes
+    apply_indexes(app.db)
+
+    from revocation import revocation_list
+    revocation_list.start(app.db)
+    from authorization import authorization_service
+    authorization_service.start(app.db)
     
     # Register blueprints
     from routes.auth import auth_bp
@@ -49,7 +57,17 @@ def create_app():
     # Health check endpoint
     @app.route('/health')
     def health():
-        return {'status': 'healthy'}, 200
+        from bot_client import bot_client
+        from response_cache import response_cache
+        from token_cache import token_cache
+        from revocation import revocation_list
+        return {
+            'status': 'healthy',
+            'bot_circuit': bot_client.breaker.state,
+            'response_cache': response_cache.stats(),
+            'token_cache': token_cache.stats(),
+            'revoked_tokens': len(revocation_list)
+        }, 200
     
     @app.route('/')
     def home():
@@ -0,0 +1,63 @@
+import threading
+import time
+
+REFRESH_SEC = 10
+
+
+class AuthorizationService:
+    """
+    Per-guild sets of dashboard-authorized user IDs, loaded from
+    `authorize_user` and kept in memory.
+
+    A daemon thread reloads the collection every `refresh_sec` seconds, so
+    permission checks never hit Mongo.
+    """
+
+    def __init__(self, refresh_sec: float = REFRESH_SEC):
+        self.refresh_sec = refresh_sec
+        self._users: dict[str, frozenset[str]] = {}
+        self._loaded = False
+        self._thread: threading.Thread | None = None
+        self.collection = None
+
+    def start(self, db):
+        self.collection = db['authorize_user']
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"⚠️ Authorized users not loaded yet: {e!r}")
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='authorize-user-sync', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.refresh_sec)
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️ Authorized user sync failed: {e!r}")
+
+    def refresh(self):
+        # The collection is a handful of documents, so every poll reloads all of
+        # them; manual edits are picked up without any version bookkeeping.
+        users = {}
+        for doc in self.collection.find({}, {'guild_id': 1, 'user_id': 1}):
+            if not doc.get('guild_id'):
+                continue
+            ids = doc.get('user_id') or []
+            if isinstance(ids, str):
+                ids = [ids]
+            users[doc['guild_id']] = frozenset(str(u) for u in ids)
+        # Swap the whole mapping so readers on other threads never see a partial update
+        self._users = users
+        self._loaded = True
+
+    def is_authorized(self, guild_id: str, user_id: str) -> bool | None:
+        """Membership from memory, or None before the first successful load."""
+        if not self._loaded:
+            return None
+        return str(user_id) in self._users.get(str(guild_id), frozenset())
+
+
+authorization_service = AuthorizationService()
@@ -0,0 +1,137 @@
+import os
+import time
+import random
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+BOT_INTERNAL_URL = os.getenv('BOT_INTERNAL_URL', 'http://bot:8080')
+
+DEFAULT_TIMEOUT = 3
+# (connect, read) timeouts per internal route
+ROUTE_TIMEOUTS = {
+    '/is_ready': (1, 2),
+    '/guilds': (1, 2),
+    '/snapshot': (1, 2),
+    '/commands': (1, 5),
+    '/commands/version': (1, 2),
+    '/channel_names': (1, 5),
+}
+MAX_RETRIES = 2
+BACKOFF_BASE_SEC = 0.1
+RETRY_STATUSES = {502, 503, 504}
+
+FAILURE_THRESHOLD = 5
+OPEN_SECONDS = 15
+
+
+class BotUnavailable(requests.ConnectionError):
+    """Raised without touching the network while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Opens after FAILURE_THRESHOLD consecutive failures and rejects calls for
+    OPEN_SECONDS, then lets a single trial request through (half-open).
+    Shared by all waitress worker threads.
+    """
+
+    def __init__(self, threshold: int = FAILURE_THRESHOLD, open_seconds: float = OPEN_SECONDS):
+        self.threshold = threshold
+        self.open_seconds = open_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_owner = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                return 'open'
+            return 'half-open'
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                return False
+            if self._trial_owner is not None:
+                return False
+            self._trial_owner = threading.get_ident()
+            return True
+
+    def release_trial(self):
+        """Frees the half-open slot if this thread holds it and the trial recorded no outcome."""
+        with self._lock:
+            if self._trial_owner == threading.get_ident():
+                self._trial_owner = None
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_owner = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_owner = None
+            if self._opened_at is not None or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+
+class BotClient:
+    """Pooled keep-alive client for the bot's internal API."""
+
+    def __init__(self, base_url: str = BOT_INTERNAL_URL):
+        self.base_url = base_url.rstrip('/')
+        self.breaker = CircuitBreaker()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, path: str, params: dict | None = None) -> requests.Response:
+        """
+        GET an internal route with its configured timeout, retrying
+        connection failures and 502/503/504 with jittered backoff.
+        """
+        if not self.breaker.allow():
+            raise BotUnavailable(f'Bot internal API circuit is open ({path})')
+        try:
+            return self._get(path, params)
+        finally:
+            self.breaker.release_trial()
+
+    def _get(self, path: str, params: dict | None) -> requests.Response:
+        timeout = ROUTE_TIMEOUTS.get(path, DEFAULT_TIMEOUT)
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = self.session.get(f'{self.base_url}{path}', params=params, timeout=timeout)
+                if response.status_code not in RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                error = None
+            except requests.ConnectionError as e:
+                error = e
+            except requests.RequestException:
+                # Read timeouts are not retried: the bot is up but slow, retrying only piles on
+                self.breaker.record_failure()
+                raise
+            except Exception:
+                self.breaker.record_failure()
+                raise
+
+            if attempt == MAX_RETRIES:
+                self.breaker.record_failure()
+                if error is not None:
+                    raise error
+                return response
+            time.sleep(BACKOFF_BASE_SEC * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+
+bot_client = BotClient()
@@ -0,0 +1,33 @@
+"""
+Index registry for every collection the API queries.
+
+Applied idempotently from create_app before the in-memory services load.
+The bot keeps its own registry (main_bot/db_indexes.py) for its collections.
+"""
+
+INDEXES = {
+    'command_config': [
+        {'keys': [('command_name', 1)]},
+    ],
+    'authorize_user': [
+        {'keys': [('guild_id', 1), ('user_id', 1)]},
+    ],
+    'revoked_tokens': [
+        # TTL: Mongo deletes the entry once the revoked token would have expired anyway
+        {'keys': [('expires_at', 1)], 'options': {'expireAfterSeconds': 0}},
+        {'keys': [('revoked_at', 1)]},
+    ],
+}
+
+
+def apply_indexes(db) -> int:
+    """Creates every registered index; returns how many failed."""
+    failed = 0
+    for collection, specs in INDEXES.items():
+        for spec in specs:
+            try:
+                db[collection].create_index(spec['keys'], **spec.get('options', {}))
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ Index {collection} {spec['keys']} not created: {e!r}")
+    return failed
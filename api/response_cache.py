@@ -0,0 +1,110 @@
+import hashlib
+import json
+import threading
+import time
+from functools import wraps
+from flask import Response, g, request
+
+
+class _Entry:
+    __slots__ = ('body', 'etag', 'version', 'fresh_until', 'expires_at')
+
+    def __init__(self, body: bytes, etag: str, version, fresh_until: float, expires_at: float):
+        self.body = body
+        self.etag = etag
+        self.version = version
+        self.fresh_until = fresh_until
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """Short-lived, thread-safe store of rendered JSON responses keyed by route."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def get(self, key: str) -> _Entry | None:
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, entry: _Entry):
+        with self._lock:
+            self._entries[key] = entry
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def count(self, outcome: str):
+        """Bumps the 'hits', 'revalidated' or 'misses' counter; waitress serves from several threads."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'revalidated': self.revalidated, 'misses': self.misses}
+
+
+response_cache = ResponseCache()
+
+
+def skip_response_cache():
+    """Call from a cached view when its data is degraded (e.g. bot offline) and must not be stored."""
+    g.skip_response_cache = True
+
+
+def _respond(entry: _Entry) -> Response:
+    # Weak comparison, as RFC 9110 requires for If-None-Match; also matches "*"
+    if request.if_none_match.contains_weak(entry.etag):
+        response = Response(status=304)
+    else:
+        response = Response(entry.body, mimetype='application/json')
+    response.headers['ETag'] = f'"{entry.etag}"'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def cached_json(key: str, ttl: float = 5, max_age: float = 60, version=None):
+    """
+    Cache a JSON view's rendered body and answer If-None-Match with 304.
+
+    Within `ttl` the cached body is served without any backend calls. After
+    that, if `version` (a cheap callable returning a content version) still
+    matches the one recorded when the body was built, the entry is renewed
+    for another `ttl`, up to `max_age`. Otherwise the view runs again.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            now = time.monotonic()
+            entry = response_cache.get(key)
+            if entry is not None and now < entry.fresh_until:
+                response_cache.count('hits')
+                return _respond(entry)
+
+            current_version = version() if version else None
+            if (entry is not None and current_version is not None
+                    and current_version == entry.version and now < entry.expires_at):
+                entry.fresh_until = now + ttl
+                response_cache.count('revalidated')
+                return _respond(entry)
+
+            response_cache.count('misses')
+            result = f(*args, **kwargs)
+            payload, status = result if isinstance(result, tuple) else (result, 200)
+            if status != 200:
+                return result
+            if isinstance(payload, Response):
+                payload = payload.get_json()
+            body = json.dumps(payload, sort_keys=True).encode()
+            etag = hashlib.sha1(body).hexdigest()[:20]
+            built = _Entry(body, etag, current_version, now + ttl, now + max_age)
+            if not g.get('skip_response_cache'):
+                response_cache.put(key, built)
+            return _respond(built)
+        return decorated
+    return decorator
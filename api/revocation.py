@@ -0,0 +1,87 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+REFRESH_SEC = 5
+
+
+class RevocationList:
+    """
+    In-memory set of revoked token IDs (`jti`), mirrored from the
+    `revoked_tokens` collection.
+
+    A daemon thread pulls only the entries revoked since its last sync, so
+    token_required checks membership without querying Mongo. Mongo's TTL
+    index removes documents once the token would have expired anyway, and
+    the local copy is pruned on the same schedule (see db_indexes).
+    """
+
+    def __init__(self, refresh_sec: float = REFRESH_SEC):
+        self.refresh_sec = refresh_sec
+        self._lock = threading.Lock()
+        self._revoked: dict[str, float] = {}
+        self._synced_until: datetime | None = None
+        self._thread: threading.Thread | None = None
+        self.collection = None
+
+    def start(self, db):
+        self.collection = db['revoked_tokens']
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"⚠️ Revocation list not loaded yet: {e!r}")
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='revocation-sync', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.refresh_sec)
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️ Revocation sync failed: {e!r}")
+
+    def refresh(self):
+        query = {}
+        if self._synced_until is not None:
+            # $gte so an entry written in the same millisecond as the last sync is not skipped
+            query['revoked_at'] = {'$gte': self._synced_until}
+        docs = list(self.collection.find(query, {'expires_at': 1, 'revoked_at': 1}))
+        latest = self._synced_until
+        now = time.time()
+        with self._lock:
+            for doc in docs:
+                self._revoked[doc['_id']] = _timestamp(doc['expires_at'])
+                if latest is None or doc['revoked_at'] > latest:
+                    latest = doc['revoked_at']
+            for jti in [j for j, exp in self._revoked.items() if exp <= now]:
+                del self._revoked[jti]
+            self._synced_until = latest
+
+    def revoke(self, jti: str, exp):
+        """Persist a revocation and apply it locally right away."""
+        expires_at = datetime.fromtimestamp(float(exp), timezone.utc)
+        self.collection.update_one(
+            {'_id': jti},
+            {'$set': {'expires_at': expires_at, 'revoked_at': datetime.now(timezone.utc)}},
+            upsert=True
+        )
+        with self._lock:
+            self._revoked[jti] = float(exp)
+
+    def is_revoked(self, jti: str | None) -> bool:
+        return jti is not None and jti in self._revoked
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+def _timestamp(value: datetime) -> float:
+    # pymongo returns naive UTC datetimes unless tz_aware is set
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+revocation_list = RevocationList()
@@ -1,9 +1,13 @@
 import os
 import jwt
+import uuid
 import requests
 from datetime import datetime, timedelta, timezone
 from functools import wraps
 from flask import Blueprint, request, jsonify, redirect, current_app
+from token_cache import token_cache
+from revocation import revocation_list
+from authorization import authorization_service
 
 
 auth_bp = Blueprint('auth', __name__)
@@ -18,36 +22,44 @@ def create_token(user_data: dict) -> str:
         'user_id': user_data['id'],
         'username': user_data['username'],
         'avatar': user_data.get('avatar'),
+        'jti': uuid.uuid4().hex,
         'exp': datetime.now(timezone.utc) + timedelta(days=7)
     }
     return jwt.encode(payload, current_app.config['SECRET_KEY'], algorithm='HS256')
 
 
+def _request_token() -> str | None:
+    """Bearer token from the Authorization header, falling back to the auth cookie"""
+    auth_header = request.headers.get('Authorization')
+    if auth_header:
+        parts = auth_header.split()
+        if len(parts) == 2 and parts[0].lower() == 'bearer':
+            return parts[1]
+    return request.cookies.get('auth_token')
+
+
 def token_required(f):
     """Decorator to require valid JWT token"""
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = None
-        auth_header = request.headers.get('Authorization')
-        if auth_header:
-            parts = auth_header.split()
-            if len(parts) == 2 and parts[0].lower() == 'bearer':
-                token = parts[1]
-
-        # Check cookie fallback
-        if not token:
-            token = request.cookies.get('auth_token')
-        
+        token = _request_token()
         if not token:
             return jsonify({'error': 'Token is missing'}), 401
         
-        try:
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
-            request.user = payload
-        except jwt.ExpiredSignatureError:
-            return jsonify({'error': 'Token has expired'}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({'error': 'Invalid token'}), 401
+        # Tokens already verified by this process skip the HS256 signature check until they expire
+        payload = token_cache.get(token)
+        if payload is None:
+            try:
+                payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
+            except jwt.ExpiredSignatureError:
+                return jsonify({'error': 'Token has expired'}), 401
+            except jwt.InvalidTokenError:
+                return jsonify({'error': 'Invalid token'}), 401
+            token_cache.put(token, payload)
+        # In-memory membership check; the list is synced from Mongo in the background
+        if revocation_list.is_revoked(payload.get('jti')):
+            return jsonify({'error': 'Token has been revoked'}), 401
+        request.user = dict(payload)
         
         return f(*args, **kwargs)
     return decorated
@@ -142,22 +154,26 @@ def me():
 @auth_bp.route('/logout', methods=['POST'])
 @token_required
 def logout():
+    token_cache.evict(_request_token())
+    if request.user.get('jti'):
+        revocation_list.revoke(request.user['jti'], request.user['exp'])
     return jsonify({'message': 'Logged out successfully'})
 
 @auth_bp.route('/authorized-user', methods=['GET'])
 @token_required
 def authorized_user():
-    data = request.get_json()
-    user_id_from_body = data.get('user_id')
-
-    if not user_id_from_body:
-        return jsonify({'error': 'Missing user_id in request body'}), 400
-    collection = current_app.db['authorize_user']
-    user = collection.find_one(
-        {
-            'guild_id': os.getenv('GUILD_ID'),
-            'user_id': str(user_id_from_body)
-        }
-    )
-    result = user is not None
-    return jsonify({'authorized': result})
\ No newline at end of file
+    """Check dashboard access: ?user_id=<id>, defaulting to the caller"""
+    user_id = request.args.get('user_id') or request.user.get('user_id')
+    if not user_id:
+        return jsonify({'error': 'Missing user_id query parameter'}), 400
+
+    guild_id = os.getenv('GUILD_ID')
+    result = authorization_service.is_authorized(guild_id, user_id)
+    if result is None:
+        # Service not loaded yet (Mongo was down at startup)
+        user = current_app.db['authorize_user'].find_one(
+            {'guild_id': guild_id, 'user_id': str(user_id)},
+            {'_id': 1}
+        )
+        result = user is not None
+    return jsonify({'authorized': result})
@@ -1,14 +1,24 @@
 import os
-import requests
 from flask import Blueprint, jsonify, request, current_app
 from routes.auth import token_required
+from bot_client import bot_client
+from response_cache import cached_json, response_cache, skip_response_cache
 
 channel_bp = Blueprint('channel', __name__)
 
-BOT_INTERNAL_URL = os.getenv('BOT_INTERNAL_URL', 'http://bot:8080')
+# Must not exceed MAX_BATCH_IDS in main_bot/internal_api.py
+CHANNEL_NAMES_BATCH = 100
+
+
+def get_guild_config_version():
+    """Version stamp of the guild_config document; bumped on every write"""
+    doc = current_app.db.guild_config.find_one({"_id": os.getenv('GUILD_ID')}, {"version": 1})
+    return str(doc.get("version", 0)) if doc else "none"
+
 
 @channel_bp.route('/', methods=['GET'])
 @token_required
+@cached_json('channels', ttl=5, max_age=60, version=get_guild_config_version)
 def list_channels():
     "Get channel that are available for configuration"
     db = current_app.db
@@ -18,24 +28,30 @@ def list_channels():
     if not doc:
         return jsonify({"channels": []}), 200
         
-    allowed_channels = doc.get("allowed_channels", [])
+    allowed_channels = [c for c in doc.get("allowed_channels", []) if c.get('channel_id')]
+    names = {}
+    ids = [c['channel_id'] for c in allowed_channels]
+    for start in range(0, len(ids), CHANNEL_NAMES_BATCH):
+        batch = ids[start:start + CHANNEL_NAMES_BATCH]
+        try:
+            resp = bot_client.get('/channel_names', params={'ids': ",".join(batch)})
+            resp.raise_for_status()
+            names.update(resp.json().get('channels', {}))
+        except Exception as e:
+            current_app.logger.warning(f"Failed to fetch channel names: {e}")
+            # Bot unreachable: don't pin "Unknown Channel" entries in the cache
+            skip_response_cache()
+            break
+
     for channel_cfg in allowed_channels:
         c_id = channel_cfg.get('channel_id')
         mode = channel_cfg.get('cmd_mode')
-        if not c_id:
-            continue
-            
-        try:
-             resp = requests.get(f'{BOT_INTERNAL_URL}/channel_name?id={c_id}', timeout=2)
-             if resp.status_code == 200:
-                 name = resp.json().get('name')
-                 allowed_commands = channel_cfg.get('allowed_commands', [])
-                 channel.append({"id": c_id, "name": name, "allowed_commands": allowed_commands, "cmd_mode": mode})
-             else:
-                 channel.append({"id": c_id, "name": "Unknown Channel", "allowed_commands": [], "cmd_mode": ""})
-        except Exception as e:
-             current_app.logger.warning(f"Failed to fetch name for channel {c_id}: {e}")
-             channel.append({"id": c_id, "name": "Unknown Channel", "allowed_commands": [], "cmd_mode": ""})
+        info = names.get(c_id)
+        if info and info.get('exists'):
+            allowed_commands = channel_cfg.get('allowed_commands', [])
+            channel.append({"id": c_id, "name": info.get('name'), "allowed_commands": allowed_commands, "cmd_mode": mode})
+        else:
+            channel.append({"id": c_id, "name": "Unknown Channel", "allowed_commands": [], "cmd_mode": ""})
 
     return jsonify({"channels": channel}), 200
 
@@ -60,15 +76,27 @@ def update_channel_commands(channel_id):
     update_query = {}
     if action == 'add':
         update_query = {'$addToSet': {'allowed_channels.$.allowed_commands': command}}
+        command_filter = {'$ne': command}
     else:
         update_query = {'$pull': {'allowed_channels.$.allowed_commands': command}}
-        
+        command_filter = command
+    # The bot polls this version to refresh its in-memory guild_config cache.
+    # The filter only matches when the command list actually changes, so the
+    # version is not bumped for no-op requests.
+    update_query['$inc'] = {'version': 1}
+
     result = db.guild_config.update_one(
-        {'_id': guild_id, 'allowed_channels.channel_id': channel_id},
+        {
+            '_id': guild_id,
+            'allowed_channels': {
+                '$elemMatch': {'channel_id': channel_id, 'allowed_commands': command_filter}
+            }
+        },
         update_query
     )
     
     if result.modified_count == 0:
         return jsonify({'error': 'Channel not found or no changes made'}), 404
+    response_cache.invalidate('channels')
         
     return jsonify({'success': True, 'action': action, 'command': command}), 200
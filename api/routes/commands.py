@@ -3,6 +3,8 @@ import os
 import requests
 from flask import Blueprint, jsonify, request, current_app
 from routes.auth import token_required
+from bot_client import bot_client
+from response_cache import cached_json, skip_response_cache
 
 commands_bp = Blueprint('commands', __name__)
 
@@ -10,21 +12,31 @@ commands_bp = Blueprint('commands', __name__)
 
 
 
-BOT_INTERNAL_URL = os.getenv('BOT_INTERNAL_URL', 'http://bot:8080')
-
-
 def get_available_commands():
     """Get commands from the running bot via internal API"""
     try:
-        response = requests.get(f'{BOT_INTERNAL_URL}/commands', timeout=5)
+        response = bot_client.get('/commands')
         if response.status_code == 200:
             return response.json().get('commands', [])
-        return []
     except requests.RequestException:
-        return []
+        pass
+    skip_response_cache()
+    return []
+
+
+def get_catalog_version():
+    """Bot-side command catalog version, or None when the bot can't be reached"""
+    try:
+        response = bot_client.get('/commands/version')
+        if response.status_code == 200:
+            return response.json().get('version')
+    except requests.RequestException:
+        pass
+    return None
 
 
 @commands_bp.route('/')
+@cached_json('commands', ttl=10, max_age=300, version=get_catalog_version)
 def list_commands():
     """List all available bot commands"""
     bot_commands = get_available_commands()
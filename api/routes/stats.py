@@ -2,39 +2,34 @@ import os
 import requests
 from flask import Blueprint, jsonify, current_app
 from routes.auth import token_required
+from bot_client import bot_client
+from response_cache import cached_json, skip_response_cache
 
 stats_bp = Blueprint('stats', __name__)
 
 
-BOT_INTERNAL_URL = os.getenv('BOT_INTERNAL_URL', 'http://bot:8080')
-
-
-def get_bot_status():
-    """Check if bot is ready via internal API"""
+def get_snapshot():
+    """Readiness and guild list from the bot's precomputed snapshot, or None if unreachable"""
     try:
-        response = requests.get(f'{BOT_INTERNAL_URL}/is_ready', timeout=2)
+        response = bot_client.get('/snapshot')
         if response.status_code == 200:
-            is_ready = response.json().get('is_ready', False)
-            return 'online' if is_ready else 'starting'
-        return 'offline'
+            return response.json()
+        return None
     except requests.RequestException:
-        return 'offline'
+        return None
 
-def get_guilds():
-    try:
-        response = requests.get(f'{BOT_INTERNAL_URL}/guilds', timeout=2)
-        if response.status_code == 200:
-            return response.json().get('guilds', [])
-        return []
-    except requests.RequestException:
-        return []
 
 @stats_bp.route('/overview')
+@cached_json('overview', ttl=10)
 def overview():
     """Get bot and server overview information (public)"""
     try:
-        status = get_bot_status()
-        guilds = get_guilds()
+        snapshot = get_snapshot()
+        if snapshot is None:
+            status, guilds = 'offline', []
+        else:
+            status = 'online' if snapshot.get('is_ready') else 'starting'
+            guilds = snapshot.get('guilds', [])
         
         target_id = os.getenv('GUILD_ID')
         guild_info = next((g for g in guilds if g['id'] == str(target_id)), 
@@ -44,6 +39,8 @@ def overview():
         current_app.logger.error(f"Failed to fetch guild info: {e}")
         guild_info = {}
         status = 'offline'
+    if status == 'offline':
+        skip_response_cache()
 
     return jsonify({
         'guild': guild_info,
@@ -66,6 +66,13 @@ export function AuthProvider({ children }: { children: ReactNode }) {
     };
 
     const logout = () => {
+        const storedToken = localStorage.getItem('auth_token');
+        if (storedToken) {
+            // Revoke the token server-side; local state is cleared either way
+            authApi.logout(storedToken).catch((error) => {
+                console.error('Logout error:', error);
+            });
+        }
         localStorage.removeItem('auth_token');
         localStorage.removeItem('auth_user');
         localStorage.removeItem('auth_is_authorized');
@@ -84,10 +84,13 @@ export const authApi = {
         apiFetch<User & { user_id: string }>('/api/auth/me', { token }),
 
     authorizedUser: (token: string, userId: string) =>
-        apiFetch<{ authorized: boolean }>('/api/auth/authorized-user', { token, body: JSON.stringify({ user_id: userId }) }),
+        apiFetch<{ authorized: boolean }>(`/api/auth/authorized-user?user_id=${encodeURIComponent(userId)}`, { token }),
 
     login: () =>
         apiFetch<{ url: string }>('/api/auth/login'),
+
+    logout: (token: string) =>
+        apiFetch<{ message: string }>('/api/auth/logout', { method: 'POST', token }),
 };
 
 export const commandsApi = {
@@ -0,0 +1,95 @@
+"""
+Parse time per REG exam page for each available BeautifulSoup backend, and
+how long the event loop stalls when pages are parsed inline versus through
+`exam.parser.ParsePool`.
+
+The fixture is a saved REG-style page; larger pages repeat its rows.
+
+Run from main_bot/:  python -m benchmarks.exam_parse
+"""
+import asyncio
+import re
+import time
+from pathlib import Path
+
+from exam.parser import ParsePool, extract_table
+
+FIXTURE = Path(__file__).parent / "fixtures" / "exam_page.html"
+SCALES = [1, 20, 100]
+REPEAT = 20
+CONCURRENT_PAGES = 8
+
+
+def scaled_page(html: str, factor: int) -> str:
+    rows = re.findall(r"\s*<tr>\s*<td.*?</tr>", html, flags=re.S)
+    return html.replace("".join(rows), "".join(rows) * factor)
+
+
+def parsers() -> list[str]:
+    available = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        available.append("lxml")
+    except ImportError:
+        pass
+    return available
+
+
+def bench_parse(html: str, parser: str) -> float:
+    extract_table(html, parser)  # warm up imports
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        extract_table(html, parser)
+    return (time.perf_counter() - start) / REPEAT
+
+
+async def max_loop_lag(work) -> float:
+    """Largest delay seen by a 1 ms ticker while `work` runs."""
+    lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, time.perf_counter() - start - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    await work()
+    done = True
+    await task
+    return lag
+
+
+async def bench_loop(html: str):
+    async def inline():
+        for _ in range(CONCURRENT_PAGES):
+            extract_table(html)
+            await asyncio.sleep(0)
+
+    pool = ParsePool()
+
+    async def pooled():
+        await asyncio.gather(*(pool.parse(html) for _ in range(CONCURRENT_PAGES)))
+
+    inline_lag = await max_loop_lag(inline)
+    pooled_lag = await max_loop_lag(pooled)
+    pool.shutdown()
+    print(f"  loop stall, {CONCURRENT_PAGES} pages inline   {inline_lag * 1e3:>9.1f} ms")
+    print(f"  loop stall, {CONCURRENT_PAGES} pages ParsePool {pooled_lag * 1e3:>9.1f} ms")
+
+
+def main():
+    base = FIXTURE.read_text(encoding="utf-8")
+    for factor in SCALES:
+        html = scaled_page(base, factor)
+        print(f"{len(extract_table(html)) - 1} exam rows, {len(html.encode()) / 1024:.1f} KiB")
+        for parser in parsers():
+            print(f"  parse {parser:<24} {bench_parse(html, parser) * 1e3:>9.2f} ms/page")
+        asyncio.run(bench_loop(html))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compare the old per-call linear name scan of `resolve_members` with the
+sorted prefix index in `cache.member_index`.
+
+Run from main_bot/:  python -m benchmarks.member_resolve
+"""
+import random
+import string
+import time
+from types import SimpleNamespace
+
+from cache.member_index import GuildMemberIndex
+
+SIZES = [10_000, 100_000]
+QUERIES = 200
+
+
+class FakeGuild:
+    def __init__(self, members):
+        self.members = members
+        self._by_id = {m.id: m for m in members}
+
+    def get_member(self, member_id):
+        return self._by_id.get(member_id)
+
+
+def _random_name(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase + string.digits, k=rng.randint(4, 14)))
+
+
+def make_guild(size: int, rng: random.Random) -> FakeGuild:
+    members = []
+    for i in range(size):
+        name = _random_name(rng)
+        display = name if rng.random() < 0.6 else _random_name(rng)
+        members.append(SimpleNamespace(id=10**17 + i, name=name, display_name=display, bot=False))
+    return FakeGuild(members)
+
+
+def linear_resolve(guild: FakeGuild, query: str):
+    """The pre-index implementation: rebuild the map, then scan every key."""
+    name_map = {}
+    for m in guild.members:
+        name_map[m.name.lower()] = m
+        name_map[m.display_name.lower()] = m
+    q = query.lower()
+    return [name_map[name] for name in name_map.keys() if name.startswith(q)]
+
+
+def bench(label: str, fn, queries) -> float:
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<18} {elapsed / len(queries) * 1e6:>12.1f} µs/query")
+    return elapsed
+
+
+def main():
+    rng = random.Random(42)
+    for size in SIZES:
+        guild = make_guild(size, rng)
+        queries = [rng.choice(guild.members).name[: rng.randint(2, 5)] for _ in range(QUERIES)]
+        print(f"{size:,} members, {QUERIES} queries")
+
+        start = time.perf_counter()
+        index = GuildMemberIndex(guild)
+        print(f"  {'index build':<18} {(time.perf_counter() - start) * 1e3:>12.1f} ms (once per guild)")
+
+        linear = bench("linear scan", lambda q: linear_resolve(guild, q), queries)
+        indexed = bench("prefix index", index.prefix, queries)
+        print(f"  speedup            {linear / indexed:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
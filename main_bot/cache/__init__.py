@@ -0,0 +1,19 @@
+from .guild_config import (
+    GuildConfigCache,
+    CompiledGuildConfig,
+    expand_prefixes
+)
+from .member_index import (
+    MemberIndex,
+    GuildMemberIndex
+)
+from .role_index import (
+    RoleIndex,
+    GuildRoleIndex
+)
+from .bot_snapshot import (
+    BotSnapshot
+)
+from .schedule_cache import (
+    ScheduleCache
+)
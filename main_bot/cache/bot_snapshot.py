@@ -0,0 +1,85 @@
+import json
+from typing import Dict
+
+import discord
+from discord.ext import commands
+
+
+def _guild_entry(guild: discord.Guild) -> dict:
+    return {
+        "id": str(guild.id),
+        "name": guild.name,
+        "icon": guild.icon.key if guild.icon else None,
+        "members": guild.member_count,
+        "region": str(guild.preferred_locale)
+    }
+
+
+class BotSnapshot:
+    """
+    Precomputed guild overview for the internal API.
+
+    Entries are updated from gateway events, and the encoded guild list is
+    cached until the next change, so serving it does not walk every guild.
+    Readiness is read live on every request rather than cached, so a gateway
+    disconnect shows up immediately.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.connected = False
+        self.version = 0
+        self._guilds: Dict[int, dict] = {}
+        self._guilds_json: str | None = None
+        bot.add_listener(self._on_ready, "on_ready")
+        bot.add_listener(self._on_resumed, "on_resumed")
+        bot.add_listener(self._on_disconnect, "on_disconnect")
+        bot.add_listener(self._on_guild_upsert, "on_guild_join")
+        bot.add_listener(self._on_guild_upsert, "on_guild_available")
+        bot.add_listener(self._on_guild_update, "on_guild_update")
+        bot.add_listener(self._on_guild_remove, "on_guild_remove")
+        bot.add_listener(self._on_guild_remove, "on_guild_unavailable")
+        bot.add_listener(self._on_member_change, "on_member_join")
+        bot.add_listener(self._on_member_change, "on_member_remove")
+
+    def _changed(self):
+        self.version += 1
+        self._guilds_json = None
+
+    @property
+    def ready(self) -> bool:
+        return self.connected and self.bot.is_ready() and not self.bot.is_closed()
+
+    def body(self) -> str:
+        """JSON text of {"is_ready", "guilds", "version"}."""
+        if self._guilds_json is None:
+            self._guilds_json = json.dumps(list(self._guilds.values()))
+        return f'{{"is_ready": {json.dumps(self.ready)}, "guilds": {self._guilds_json}, "version": {self.version}}}'
+
+    async def _on_ready(self):
+        self.connected = True
+        self._guilds = {guild.id: _guild_entry(guild) for guild in self.bot.guilds if not guild.unavailable}
+        self._changed()
+
+    async def _on_resumed(self):
+        self.connected = True
+
+    async def _on_disconnect(self):
+        self.connected = False
+
+    async def _on_guild_upsert(self, guild: discord.Guild):
+        self._guilds[guild.id] = _guild_entry(guild)
+        self._changed()
+
+    async def _on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        await self._on_guild_upsert(after)
+
+    async def _on_guild_remove(self, guild: discord.Guild):
+        if self._guilds.pop(guild.id, None) is not None:
+            self._changed()
+
+    async def _on_member_change(self, member: discord.Member):
+        entry = self._guilds.get(member.guild.id)
+        if entry is not None and entry["members"] != member.guild.member_count:
+            entry["members"] = member.guild.member_count
+            self._changed()
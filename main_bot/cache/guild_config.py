@@ -0,0 +1,164 @@
+import logging
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from discord.ext import commands, tasks
+
+log = logging.getLogger(__name__)
+
+POLL_INTERVAL_SEC = 30
+
+EXEMPT_COMMANDS = frozenset({
+    "command-add",
+    "channel-configure",
+    "channel-remove",
+    "channel-list",
+    "help",
+    "command-allow-all",
+    "prefix-set",
+})
+EXEMPT_COGS = frozenset({"Core", "Maintenance", "Info"})
+
+
+def expand_prefixes(prefixes) -> Tuple[str, ...]:
+    """Prefixes plus their lower/upper case variants, deduplicated in order."""
+    return tuple(dict.fromkeys(v for p in prefixes for v in (p, p.lower(), p.upper())))
+
+
+class CompiledGuildConfig:
+    """
+    Lookup-friendly form of a `guild_config` document.
+
+    `channels` maps a channel id to its `cmd_mode` and the frozenset of
+    canonical command names it lists, with aliases already resolved, so a
+    permission decision is a dict lookup plus a set lookup.
+    `moderator_roles` and `prefixes` are None when the guild has not
+    configured its own moderator role IDs or command prefixes.
+    """
+
+    __slots__ = ("doc", "restricted", "channels", "moderator_roles", "prefixes")
+
+    def __init__(self, doc: Dict[str, Any], bot: commands.Bot):
+        self.doc = doc
+        self.restricted = doc.get("mode", "all") != "all"
+        self.channels: Dict[str, Tuple[str, FrozenSet[str]]] = {}
+
+        for entry in doc.get("allowed_channels", []):
+            channel_id = entry.get("channel_id")
+            if channel_id in self.channels:
+                continue
+            names = set()
+            for name in entry.get("allowed_commands", []) or []:
+                cmd = bot.get_command(name)
+                names.add(cmd.qualified_name if cmd else name)
+            self.channels[channel_id] = (entry.get("cmd_mode", "all"), frozenset(names))
+
+        moderator_roles = doc.get("moderator_roles")
+        self.moderator_roles = frozenset(int(r) for r in moderator_roles) if moderator_roles else None
+        self.prefixes = expand_prefixes(doc["prefixes"]) if doc.get("prefixes") else None
+
+
+class GuildConfigCache:
+    """
+    Process-wide cache of `guild_config` documents.
+
+    Every writer bumps the document's `version` field with `$inc`, so the
+    bot can notice edits made outside this process (the dashboard API) by
+    polling the versions only. Writers inside the bot call `invalidate`
+    directly so their change is visible on the next command.
+    """
+
+    def __init__(self, bot: commands.Bot, poll_interval: float = POLL_INTERVAL_SEC):
+        self.bot = bot
+        self.collection = bot.db["guild_config"]
+        self._docs: Dict[str, Optional[CompiledGuildConfig]] = {}
+        self._exempt: Optional[FrozenSet[str]] = None
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self._poll = tasks.loop(seconds=poll_interval)(self.refresh_changed)
+
+    async def warm(self):
+        """Load every guild config into memory and start the version poll."""
+        count = 0
+        async for doc in self.collection.find({}):
+            self._store(doc["_id"], doc)
+            count += 1
+        print(f"✅ Guild config cache warmed ({count} guilds)")
+        if not self._poll.is_running():
+            self._poll.start()
+
+    def stop(self):
+        self._poll.cancel()
+
+    def _store(self, guild_id: str, doc: Optional[Dict[str, Any]]):
+        self._docs[guild_id] = CompiledGuildConfig(doc, self.bot) if doc else None
+        self._versions[guild_id] = (doc or {}).get("version", 0)
+
+    @property
+    def exempt(self) -> FrozenSet[str]:
+        """Qualified names of commands that bypass channel restrictions."""
+        if self._exempt is None:
+            self._exempt = EXEMPT_COMMANDS | frozenset(
+                c.qualified_name for c in self.bot.walk_commands() if c.cog_name in EXEMPT_COGS
+            )
+        return self._exempt
+
+    def rebuild_command_index(self):
+        """Recompile everything after the command table changed (cog load/unload)."""
+        self._exempt = None
+        for key, compiled in list(self._docs.items()):
+            if compiled is not None:
+                self._docs[key] = CompiledGuildConfig(compiled.doc, self.bot)
+
+    async def get(self, guild_id: int | str) -> Optional[CompiledGuildConfig]:
+        key = str(guild_id)
+        if key in self._docs:
+            self.hits += 1
+            return self._docs[key]
+
+        self.misses += 1
+        doc = await self.collection.find_one({"_id": key})
+        # Missing configs are cached as None so unconfigured guilds stay off the DB too.
+        self._store(key, doc)
+        return self._docs[key]
+
+    async def update(self, guild_id: int | str, update: Dict[str, Any], upsert: bool = False):
+        """Writes the config, bumps its version and drops the cached copy."""
+        update = {**update, "$inc": {"version": 1}}
+        result = await self.collection.update_one({"_id": str(guild_id)}, update, upsert=upsert)
+        self.invalidate(guild_id)
+        return result
+
+    def invalidate(self, guild_id: int | str):
+        key = str(guild_id)
+        self._docs.pop(key, None)
+        self._versions.pop(key, None)
+
+    async def refresh_changed(self):
+        """Reload only the documents whose `version` differs from the cached one."""
+        try:
+            seen = set()
+            async for stamp in self.collection.find({}, {"version": 1}):
+                key = stamp["_id"]
+                seen.add(key)
+                if key in self._docs and self._versions.get(key) == stamp.get("version", 0):
+                    continue
+                self._store(key, await self.collection.find_one({"_id": key}))
+                self.reloads += 1
+
+            for key in [k for k in self._docs if k not in seen and self._docs[k] is not None]:
+                self._store(key, None)
+                self.reloads += 1
+        except Exception as e:
+            log.warning(f"Guild config poll failed: {e!r}")
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "reloads": self.reloads,
+            "hit_rate": round(self.hits / total, 4) if total else None,
+            "guilds": len(self._docs),
+        }
@@ -0,0 +1,125 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Set, Tuple
+
+import discord
+from discord.ext import commands
+
+
+def _member_keys(member: discord.Member) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys((member.name.lower(), member.display_name.lower())))
+
+
+class GuildMemberIndex:
+    """
+    Sorted prefix index over the usernames and display names of one guild.
+
+    Keys are kept in a sorted list so a prefix query is a bisect followed by
+    a short forward scan over the matching keys only.
+    """
+
+    def __init__(self, guild: discord.Guild):
+        self.guild = guild
+        self._ids_by_key: Dict[str, Set[int]] = {}
+        self._keys_by_id: Dict[int, Tuple[str, ...]] = {}
+        for member in guild.members:
+            keys = _member_keys(member)
+            self._keys_by_id[member.id] = keys
+            for key in keys:
+                self._ids_by_key.setdefault(key, set()).add(member.id)
+        self._keys: List[str] = sorted(self._ids_by_key)
+
+    def add(self, member: discord.Member):
+        if member.id in self._keys_by_id:
+            self.remove(member.id)
+        keys = _member_keys(member)
+        self._keys_by_id[member.id] = keys
+        for key in keys:
+            ids = self._ids_by_key.get(key)
+            if ids is None:
+                self._ids_by_key[key] = ids = set()
+                insort(self._keys, key)
+            ids.add(member.id)
+
+    def remove(self, member_id: int):
+        for key in self._keys_by_id.pop(member_id, ()):
+            ids = self._ids_by_key.get(key)
+            if ids is None:
+                continue
+            ids.discard(member_id)
+            if not ids:
+                del self._ids_by_key[key]
+                del self._keys[bisect_left(self._keys, key)]
+
+    def _resolve(self, ids: Set[int]) -> Iterator[discord.Member]:
+        for member_id in sorted(ids):
+            member = self.guild.get_member(member_id)
+            if member is not None:
+                yield member
+
+    def exact(self, name: str) -> List[discord.Member]:
+        return list(self._resolve(self._ids_by_key.get(name.lower(), set())))
+
+    def prefix(self, query: str) -> List[discord.Member]:
+        """Members whose username or display name starts with `query`, exact matches first."""
+        q = query.lower()
+        found: Dict[int, discord.Member] = {}
+        i = bisect_left(self._keys, q)
+        while i < len(self._keys) and self._keys[i].startswith(q):
+            for member in self._resolve(self._ids_by_key[self._keys[i]]):
+                found.setdefault(member.id, member)
+            i += 1
+        return list(found.values())
+
+    def __len__(self) -> int:
+        return len(self._keys_by_id)
+
+
+class MemberIndex:
+    """
+    Per-guild member name indexes, built on first use and then kept current
+    from member join/remove/update events instead of being rebuilt per command.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._guilds: Dict[int, GuildMemberIndex] = {}
+        bot.add_listener(self._on_member_join, "on_member_join")
+        bot.add_listener(self._on_member_remove, "on_member_remove")
+        bot.add_listener(self._on_member_update, "on_member_update")
+        bot.add_listener(self._on_user_update, "on_user_update")
+        bot.add_listener(self._on_guild_remove, "on_guild_remove")
+
+    def for_guild(self, guild: discord.Guild) -> GuildMemberIndex:
+        index = self._guilds.get(guild.id)
+        if index is None:
+            index = GuildMemberIndex(guild)
+            # Until the member list is chunked the index would be partial, so only keep it afterwards.
+            if guild.chunked:
+                self._guilds[guild.id] = index
+        return index
+
+    async def _on_member_join(self, member: discord.Member):
+        index = self._guilds.get(member.guild.id)
+        if index is not None:
+            index.add(member)
+
+    async def _on_member_remove(self, member: discord.Member):
+        index = self._guilds.get(member.guild.id)
+        if index is not None:
+            index.remove(member.id)
+
+    async def _on_member_update(self, before: discord.Member, after: discord.Member):
+        if _member_keys(before) == _member_keys(after):
+            return
+        await self._on_member_join(after)
+
+    async def _on_user_update(self, before: discord.User, after: discord.User):
+        if before.name == after.name and before.display_name == after.display_name:
+            return
+        for index in self._guilds.values():
+            member = index.guild.get_member(after.id)
+            if member is not None:
+                index.add(member)
+
+    async def _on_guild_remove(self, guild: discord.Guild):
+        self._guilds.pop(guild.id, None)
@@ -0,0 +1,164 @@
+from bisect import bisect_left, insort
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import discord
+from discord.ext import commands
+
+
+class GuildRoleIndex:
+    """
+    Exact and prefix lookup over the role names of one guild.
+
+    Exact lookups are case-sensitive like `discord.utils.get(guild.roles, name=...)`;
+    prefix lookups are case-insensitive over a sorted list of lowercase names.
+    Also caches the guild's moderator role IDs and members' top-role
+    positions; both are dropped on any role change.
+    """
+
+    DEFAULT_MODERATOR_KEYWORD = "Moderator"
+
+    def __init__(self, guild: discord.Guild):
+        self.guild = guild
+        self._names: Dict[int, str] = {}
+        self._by_name: Dict[str, Dict[int, None]] = {}
+        self._by_lower: Dict[str, Dict[int, None]] = {}
+        for role in guild.roles:
+            self._link(role)
+        self._keys: List[str] = sorted(self._by_lower)
+        self._moderators: Optional[Tuple[Optional[FrozenSet[int]], FrozenSet[int]]] = None
+        self._top_positions: Dict[int, int] = {}
+
+    def roles_changed(self):
+        self._moderators = None
+        self._top_positions.clear()
+
+    def member_changed(self, member_id: int):
+        self._top_positions.pop(member_id, None)
+
+    def moderator_ids(self, configured: Optional[FrozenSet[int]] = None) -> FrozenSet[int]:
+        """
+        Role IDs that grant moderator access: the guild's configured list, or
+        every role whose name contains "Moderator" when nothing is configured.
+        """
+        if self._moderators is None or self._moderators[0] != configured:
+            if configured:
+                ids = configured
+            else:
+                ids = frozenset(
+                    role_id for role_id, name in self._names.items()
+                    if self.DEFAULT_MODERATOR_KEYWORD in name
+                )
+            self._moderators = (configured, ids)
+        return self._moderators[1]
+
+    def top_position(self, member: discord.Member) -> int:
+        position = self._top_positions.get(member.id)
+        if position is None:
+            position = self._top_positions[member.id] = member.top_role.position
+        return position
+
+    def _link(self, role: discord.Role) -> bool:
+        """Adds the role to the name maps; returns True when its lowercase key is new."""
+        self._names[role.id] = role.name
+        self._by_name.setdefault(role.name, {})[role.id] = None
+        lower = role.name.lower()
+        is_new = lower not in self._by_lower
+        self._by_lower.setdefault(lower, {})[role.id] = None
+        return is_new
+
+    def add(self, role: discord.Role):
+        self.roles_changed()
+        if role.id in self._names:
+            self.remove(role.id)
+        if self._link(role):
+            insort(self._keys, role.name.lower())
+
+    def remove(self, role_id: int):
+        self.roles_changed()
+        name = self._names.pop(role_id, None)
+        if name is None:
+            return
+        ids = self._by_name.get(name, {})
+        ids.pop(role_id, None)
+        if not ids:
+            self._by_name.pop(name, None)
+
+        lower = name.lower()
+        ids = self._by_lower.get(lower, {})
+        ids.pop(role_id, None)
+        if not ids:
+            self._by_lower.pop(lower, None)
+            del self._keys[bisect_left(self._keys, lower)]
+
+    def get(self, name: str) -> Optional[discord.Role]:
+        for role_id in self._by_name.get(name, ()):
+            role = self.guild.get_role(role_id)
+            if role is not None:
+                return role
+        return None
+
+    def prefix(self, query: str) -> List[discord.Role]:
+        q = query.lower()
+        found: List[discord.Role] = []
+        i = bisect_left(self._keys, q)
+        while i < len(self._keys) and self._keys[i].startswith(q):
+            for role_id in self._by_lower[self._keys[i]]:
+                role = self.guild.get_role(role_id)
+                if role is not None:
+                    found.append(role)
+            i += 1
+        return found
+
+
+class RoleIndex:
+    """
+    Per-guild role name indexes, built on first use and then kept current
+    from role create/update/delete and member update events.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._guilds: Dict[int, GuildRoleIndex] = {}
+        bot.add_listener(self._on_role_upsert, "on_guild_role_create")
+        bot.add_listener(self._on_role_update, "on_guild_role_update")
+        bot.add_listener(self._on_role_delete, "on_guild_role_delete")
+        bot.add_listener(self._on_member_update, "on_member_update")
+        bot.add_listener(self._on_member_remove, "on_member_remove")
+        bot.add_listener(self._on_guild_remove, "on_guild_remove")
+
+    def for_guild(self, guild: discord.Guild) -> GuildRoleIndex:
+        index = self._guilds.get(guild.id)
+        if index is None:
+            index = self._guilds[guild.id] = GuildRoleIndex(guild)
+        return index
+
+    async def _on_role_upsert(self, role: discord.Role):
+        index = self._guilds.get(role.guild.id)
+        if index is not None:
+            index.add(role)
+
+    async def _on_role_update(self, before: discord.Role, after: discord.Role):
+        if before.name != after.name:
+            await self._on_role_upsert(after)
+            return
+        index = self._guilds.get(after.guild.id)
+        if index is not None:
+            index.roles_changed()
+
+    async def _on_role_delete(self, role: discord.Role):
+        index = self._guilds.get(role.guild.id)
+        if index is not None:
+            index.remove(role.id)
+
+    async def _on_member_update(self, before: discord.Member, after: discord.Member):
+        index = self._guilds.get(after.guild.id)
+        if index is not None and before.roles != after.roles:
+            index.member_changed(after.id)
+
+    async def _on_member_remove(self, member: discord.Member):
+        index = self._guilds.get(member.guild.id)
+        if index is not None:
+            index.member_changed(member.id)
+
+    async def _on_guild_remove(self, guild: discord.Guild):
+        self._guilds.pop(guild.id, None)
@@ -0,0 +1,94 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from discord.ext import commands
+from pymongo import ReturnDocument
+
+TTL_SEC = 300
+MAX_ENTRIES = 1024
+SCHEDULE_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+PROJECTION = {"_id": 0, "user_id": 1, **{day: 1 for day in SCHEDULE_DAYS}}
+
+Key = Tuple[str, int]
+
+
+class ScheduleCache:
+    """
+    Read-through cache of per-(guild, user) `schedules` documents with a TTL
+    and LRU eviction.
+
+    Writes go through `update`, which applies the change with
+    find_one_and_update and stores the returned document, so an interactive
+    edit flow re-renders from memory instead of reading the timetable again.
+    """
+
+    def __init__(self, bot: commands.Bot, ttl: float = TTL_SEC, max_entries: int = MAX_ENTRIES):
+        self.collection = bot.db["schedules"]
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Key, Tuple[Optional[Dict[str, Any]], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(guild_id: int | str, user_id: int) -> Dict[str, Any]:
+        return {"guild_id": str(guild_id), "user_id": user_id}
+
+    def _store(self, key: Key, doc: Optional[Dict[str, Any]]):
+        self._entries[key] = (doc, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, guild_id: int | str, user_id: int) -> Optional[Dict[str, Any]]:
+        key = (str(guild_id), user_id)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        doc = await self.collection.find_one(self.key(guild_id, user_id), PROJECTION)
+        # Users without a timetable are cached as None too
+        self._store(key, doc)
+        return doc
+
+    async def update(
+        self,
+        guild_id: int | str,
+        user_id: int,
+        update: Dict[str, Any],
+        extra_filter: Optional[Dict[str, Any]] = None,
+        upsert: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Applies the write and refreshes the cached copy from its result; returns the new document."""
+        doc = await self.collection.find_one_and_update(
+            {**self.key(guild_id, user_id), **(extra_filter or {})},
+            update,
+            projection=PROJECTION,
+            upsert=upsert,
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc is None:
+            # Nothing matched the extra filter; the cached copy may be stale, so drop it
+            self.invalidate(guild_id, user_id)
+        else:
+            self._store((str(guild_id), user_id), doc)
+        return doc
+
+    def invalidate(self, guild_id: int | str, user_id: int):
+        self._entries.pop((str(guild_id), user_id), None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else None,
+            "entries": len(self._entries),
+        }
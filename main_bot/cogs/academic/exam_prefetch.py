@@ -0,0 +1,127 @@
+import discord
+from discord.ext import commands, tasks
+import asyncio
+import random
+import time
+import os
+import datetime
+
+BANGKOK = datetime.timezone(datetime.timedelta(hours=7))
+PREFETCH_CONCURRENCY = int(os.getenv("EXAM_PREFETCH_CONCURRENCY", "3"))
+PREFETCH_JITTER_SEC = float(os.getenv("EXAM_PREFETCH_JITTER_SEC", "2"))
+
+
+def _parse_date(value: str | None) -> datetime.date | None:
+    try:
+        return datetime.date.fromisoformat(value) if value else None
+    except ValueError:
+        print(f"⚠️ Invalid exam window date: {value!r} (expected YYYY-MM-DD)")
+        return None
+
+
+class ExamPrefetch(commands.Cog):
+    """
+    Refreshes the exam cache for every registered student ahead of the
+    morning rush during the exam window (EXAM_WINDOW_START..EXAM_WINDOW_END).
+    Optionally DMs students whose table changed (EXAM_NOTIFY_CHANGES=1).
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.db = self.bot.db
+        self.window_start = _parse_date(os.getenv("EXAM_WINDOW_START"))
+        self.window_end = _parse_date(os.getenv("EXAM_WINDOW_END"))
+        self.notify_changes = os.getenv("EXAM_NOTIFY_CHANGES") == "1"
+
+    async def cog_load(self):
+        if self.bot.instance == "server":
+            self.prefetch_task.start()
+        else:
+            self.prefetch_task.cancel()
+
+    async def cog_unload(self):
+        self.prefetch_task.cancel()
+
+    def in_window(self, today: datetime.date) -> bool:
+        if self.window_start is None or self.window_end is None:
+            return False
+        return self.window_start <= today <= self.window_end
+
+    async def registered_students(self) -> dict[str, set[int]]:
+        """std_id -> user IDs, from both layouts found in `std_id`."""
+        students: dict[str, set[int]] = {}
+        collection = self.db["std_id"]
+        async for doc in collection.find({"std_id": {"$exists": True}}, {"user_id": 1, "std_id": 1}):
+            if doc.get("std_id"):
+                students.setdefault(str(doc["std_id"]), set()).add(doc.get("user_id"))
+        async for doc in collection.find({"member_id": {"$exists": True}}, {"member_id": 1}):
+            for item in doc.get("member_id", []):
+                if item.get("std_id"):
+                    students.setdefault(str(item["std_id"]), set()).add(item.get("user_id"))
+        return students
+
+    async def _notify(self, user_ids: set[int]):
+        for user_id in user_ids:
+            if user_id is None:
+                continue
+            try:
+                user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+                await user.send("📢 ตารางสอบของคุณมีการเปลี่ยนแปลง ใช้คำสั่ง `exam` เพื่อดูตารางล่าสุด")
+            except (discord.Forbidden, discord.NotFound, discord.HTTPException) as e:
+                print(f"⚠️ Could not DM {user_id} about exam change: {e}")
+
+    @tasks.loop(time=[datetime.time(hour=5, minute=30, tzinfo=BANGKOK), datetime.time(hour=12, minute=30, tzinfo=BANGKOK)])
+    async def prefetch_task(self):
+        if not self.in_window(datetime.datetime.now(BANGKOK).date()):
+            return
+
+        students = await self.registered_students()
+        if not students:
+            return
+
+        semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+        counts = {"refreshed": 0, "changed": 0, "failed": 0}
+
+        async def refresh(std_id: str, user_ids: set[int]):
+            async with semaphore:
+                # Jitter spreads requests so REG does not see a burst at the top of the hour
+                await asyncio.sleep(random.uniform(0, PREFETCH_JITTER_SEC))
+                try:
+                    _, changed = await self.bot.exam_cache.refresh(std_id)
+                except Exception as e:
+                    counts["failed"] += 1
+                    print(f"⚠️ Exam prefetch failed for {std_id}: {e!r}")
+                    return
+            counts["refreshed"] += 1
+            if changed:
+                counts["changed"] += 1
+                if self.notify_changes:
+                    await self._notify(user_ids)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(refresh(std_id, users) for std_id, users in students.items()))
+        elapsed = time.perf_counter() - start
+
+        report = {
+            **counts,
+            "students": len(students),
+            "elapsed_sec": round(elapsed, 2),
+            "per_minute": round(counts["refreshed"] / elapsed * 60, 1) if elapsed else None,
+            "ran_at": datetime.datetime.now(datetime.timezone.utc),
+        }
+        print(
+            f"✅ Exam prefetch: {counts['refreshed']}/{len(students)} refreshed, "
+            f"{counts['changed']} changed, {counts['failed']} failed "
+            f"in {elapsed:.1f}s ({report['per_minute']}/min)"
+        )
+        try:
+            await self.db["exam_prefetch_runs"].insert_one({"instance": self.bot.instance, **report})
+        except Exception as e:
+            print(f"⚠️ Failed to store exam prefetch report: {e!r}")
+
+    @prefetch_task.before_loop
+    async def before_prefetch_task(self):
+        await self.bot.wait_until_ready()
+
+async def setup(bot):
+    await bot.add_cog(ExamPrefetch(bot))
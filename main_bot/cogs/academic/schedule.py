@@ -4,10 +4,8 @@ import discord
 from discord.ext import commands
 from components.pagination_view import PaginationView, ExamEmbedStrategy, ClassEmbedStrategy
 from components.schedule_components import * 
-from validation import resolve_members 
-import re, datetime , os
-import requests
-from bs4 import BeautifulSoup
+from validation import resolve_members, IndexedMember
+import re, datetime , os, asyncio
 # --------------------------------------------------
 #Cog Logic
 # --------------------------------------------------
@@ -20,9 +18,25 @@ class Schedule(commands.Cog):
         except Exception as e:
             print(f"❌ Schedule Cog connection failed: {e}")
 
+    async def cog_load(self):
+        # Runs in the background so a large migration does not hold up startup
+        self._migration = asyncio.create_task(self._migrate_layout())
+
+    async def _migrate_layout(self):
+        try:
+            if await migrate_schedule_layout(self.db, os.getenv("GUILD_ID")):
+                # Lookups made while the migration ran may have cached "no schedule"
+                self.schedules.clear()
+        except Exception as e:
+            print(f"❌ Schedule migration failed (will retry next start): {e!r}")
+
     @property
     def db(self):
         return self.bot.db["schedules"]
+
+    @property
+    def schedules(self):
+        return self.bot.schedule_cache
     
     @property
     def examdb(self):   
@@ -104,7 +118,7 @@ class Schedule(commands.Cog):
         )
 
     @commands.command(name="examschedule", aliases=["ex", "exam"])
-    async def exam_schedule(self, ctx: commands.Context, user_handler: discord.Member | str = None):
+    async def exam_schedule(self, ctx: commands.Context, user_handler: IndexedMember | str = None):
         if self.examdb is None: return await ctx.send("❌ DB Error")
         
         user = ctx.author
@@ -133,27 +147,12 @@ class Schedule(commands.Cog):
         # Scrape Data
         msg = await ctx.send("🔄 กำลังดึงข้อมูลจาก REG...")
         try:
-            url = os.getenv("API_ENDPOINT","")
-            if url == "":
+            if not self.bot.exam_client.url:
                 return await msg.edit(content="API Endpoint not found")
 
-            params = {"IDcard": doc.get("std_id", "")}
-            
-            r = await self.bot.loop.run_in_executor(None, lambda: requests.get(url, params=params, timeout=5))
-            r.encoding = "utf-8"
-            soup = BeautifulSoup(r.text, "html.parser")
-            rows = soup.find_all("tr")
-            
-            if not rows:
-                return await msg.edit(content="🤔 ไม่พบข้อมูลตารางสอบในระบบ")
-
-            data_rows = []
-            for tr in rows:
-                cols = [td.get_text(strip=True) for td in tr.find_all(['td', 'th'])]
-                if cols: data_rows.append(cols)
-
+            data_rows = await self.bot.exam_cache.get(doc.get("std_id", ""))
             if not data_rows:
-                return await msg.edit(content="🤔 ตารางเปล่า")
+                return await msg.edit(content="🤔 ไม่พบข้อมูลตารางสอบในระบบ")
 
             headers = data_rows[0]
             exam_entries = data_rows[1:] 
@@ -174,21 +173,21 @@ class Schedule(commands.Cog):
                       aliases=["asch", "ac"],
                       help="Add subject data to user's database")
     async def add_class_interactive(self, ctx: commands.Context):
-        if self.db is None: return await ctx.send("❌ DB Error")
+        if self.schedules is None: return await ctx.send("❌ DB Error")
         
-        selector=DaySelect(self.db)
-        view = AddClassView(author=ctx.author, db_collection=self.db, Selector=selector)
+        selector=DaySelect(self.schedules)
+        view = AddClassView(author=ctx.author, db_collection=self.schedules, Selector=selector)
         await ctx.send("เลือกวันเรียนเพื่อเพิ่มวิชา 👇", view=view)
 
     @commands.command(name="editclass",
                       aliases=["ec","esch"],
                       help="Edit the subject information")
     async def edit_class_info(self,ctx :commands.Context):
-        if self.db is None:
+        if self.schedules is None:
             return await ctx.send("❌ DB Error")
-        option = await generate_options(self.db,ctx.guild.id, ctx.author.id)
-        selector=editSubjectSelect(self.db,ctx.author,option)
-        view = AddClassView(author=ctx.author,db_collection=self.db,Selector=selector)
+        option = await generate_options(self.schedules,ctx.guild.id, ctx.author.id)
+        selector=editSubjectSelect(self.schedules,ctx.author,option)
+        view = AddClassView(author=ctx.author,db_collection=self.schedules,Selector=selector)
         await ctx.send("เลือกวิชาที่ต้องการแก้ไข 👇", view=view)
         
     @commands.command(
@@ -196,9 +195,9 @@ class Schedule(commands.Cog):
             aliases=["msch", "mc"],
             help="Show the subjects list of provided user if none show self"
             )
-    async def my_schedule(self, ctx: commands.Context, user_handler: discord.Member | str = None, *params: str):
+    async def my_schedule(self, ctx: commands.Context, user_handler: IndexedMember | str = None, *params: str):
 
-        if self.db is None: return await ctx.send("❌ DB Error")
+        if self.schedules is None: return await ctx.send("❌ DB Error")
     
         user = ctx.author
         if user_handler:
@@ -210,7 +209,7 @@ class Schedule(commands.Cog):
                 resolved = await resolve_members(ctx, user_handler)
                 if resolved: user = resolved[0]
 
-        doc = await get_user_schedule(self.db, ctx.guild.id, user.id)
+        doc = await get_user_schedule(self.schedules, ctx.guild.id, user.id)
         if not doc:
             return await ctx.send(f"🤔 {user.display_name} ยังไม่มีตารางเรียนนะ! ลองใช้ `addclass` ดูสิ")
 
@@ -235,20 +234,20 @@ class Schedule(commands.Cog):
                       help="Delete subject from user's database" 
                       )
     async def delete_class(self, ctx: commands.Context):
-        if self.db is None: return await ctx.send("❌ DB Error")
-        doc = await get_user_schedule(self.db,ctx.guild.id, ctx.author.id)
+        if self.schedules is None: return await ctx.send("❌ DB Error")
+        doc = await get_user_schedule(self.schedules,ctx.guild.id, ctx.author.id)
         if not doc:
             await ctx.send("🤔 คุณยังไม่มีตารางเรียน")
             return
 
-        options = await generate_options(self.db, ctx.guild.id, ctx.author.id)
+        options = await generate_options(self.schedules, ctx.guild.id, ctx.author.id)
 
         if not options:
             await ctx.send("🤔 ตารางเรียนว่างเปล่า")
             return
 
-        selector = delSubjectSelect(self.db, ctx.author, options[:25])
-        view = AddClassView(author=ctx.author, db_collection=self.db, Selector=selector)
+        selector = delSubjectSelect(self.schedules, ctx.author, options[:25])
+        view = AddClassView(author=ctx.author, db_collection=self.schedules, Selector=selector)
 
         await ctx.send("เลือกรายวิชาที่ต้องการจะลบ 👇", view=view)
 
@@ -64,6 +64,9 @@ class ChannelManagement(commands.Cog):
         doc = await self.collection.find_one({"_id": str(guild_id)})
         return doc if doc is not None else {}
 
+    async def _update_guild_config(self, guild_id: int, update: Dict[str, Any], upsert: bool = False):
+        return await self.bot.config_cache.update(guild_id, update, upsert=upsert)
+
     async def _check_guild_context(self, ctx: commands.Context) -> Optional[discord.Guild]:
         if ctx.guild is None:
             await ctx.send("❌ This command can only be used in a server.")
@@ -155,8 +158,8 @@ class ChannelManagement(commands.Cog):
                     "allowed_channels": [],
                 }
                 
-                await self.collection.update_one(
-                    {"_id": str(guild.id)},
+                await self._update_guild_config(
+                    guild.id,
                     {"$set": update_fields},
                     upsert=True,
                 )
@@ -171,8 +174,8 @@ class ChannelManagement(commands.Cog):
                     discord.Color.orange()
                 )
             else:
-                await self.collection.update_one(
-                    {"_id": str(guild.id)},
+                await self._update_guild_config(
+                    guild.id,
                     {"$set": {"allowed_channels": allowed_channels}},
                     upsert=True,
                 )
@@ -184,7 +187,7 @@ class ChannelManagement(commands.Cog):
                     discord.Color.green()
                 )
             
-            moderator_role = discord.utils.find(lambda r: r.name == 'Moderator', guild.roles)
+            moderator_role = self.bot.role_index.for_guild(guild).get('Moderator')
             mention = moderator_role.mention if critical and moderator_role else ""
             
             await ctx.send(content=mention, embed=embed)
@@ -243,8 +246,8 @@ class ChannelManagement(commands.Cog):
                     build_channel_entry(thread_id, existing_channels.get(thread_id), cmd.qualified_name)
                 )
         
-        await self.collection.update_one(
-            {"_id": str(guild.id)},
+        await self._update_guild_config(
+            guild.id,
             {"$set": {"allowed_channels": all_channels}},
             upsert=True
         )
@@ -289,8 +292,8 @@ class ChannelManagement(commands.Cog):
         )
         if idx == -1:
 
-            await self.collection.update_one(
-                {"_id": str(guild.id)},
+            await self._update_guild_config(
+                guild.id,
                 {"$addToSet": 
                 {"allowed_channels": 
                         {"channel_id": str(ctx.channel.id), 
@@ -307,8 +310,8 @@ class ChannelManagement(commands.Cog):
                 await ctx.send("Command already allowed in this channel.")
                 return
             query = f"allowed_channels.{idx}.allowed_commands"
-            await self.collection.update_one(
-                {"_id": str(guild.id)},
+            await self._update_guild_config(
+                guild.id,
                 {"$addToSet": {query: name}},
                 upsert=True
             )
@@ -390,8 +393,8 @@ class ChannelManagement(commands.Cog):
             }
             title = "✅ Channel enabled"
 
-        await self.collection.update_one(
-            {"_id": str(guild.id)},
+        await self._update_guild_config(
+            guild.id,
             update_data,
             upsert=True,
         )
@@ -416,6 +419,39 @@ class ChannelManagement(commands.Cog):
         embed = create_embed(title, description, discord.Color.green())
         await ctx.send(embed=embed)
 
+    # --- prefix command ---
+
+    @commands.hybrid_command(
+        name="prefix-set",
+        description="Set this server's command prefixes, or 'reset' for the defaults.",
+        help="Set server command prefixes (e.g. `prefix-set ! ?`), or `reset`."
+    )
+    @app_commands.describe(prefixes="Prefixes separated by spaces, or 'reset'.")
+    @validation.role()
+    async def set_prefix(self, ctx: commands.Context, *, prefixes: str):
+        guild = await self._check_guild_context(ctx)
+        if guild is None:
+            return
+
+        values = list(dict.fromkeys(prefixes.split()))
+        if values == ["reset"]:
+            await self._update_guild_config(guild.id, {"$unset": {"prefixes": ""}}, upsert=True)
+            await ctx.send("✅ Command prefixes reset to the defaults.")
+            return
+
+        if not values or len(values) > 5 or any(len(p) > 5 for p in values):
+            await ctx.send("❌ Provide 1–5 prefixes, each at most 5 characters.")
+            return
+
+        await self._update_guild_config(guild.id, {"$set": {"prefixes": values}}, upsert=True)
+        await ctx.send(
+            embed=create_embed(
+                "✅ Prefixes updated",
+                "Prefixes: " + " ".join(f"**`{p}`**" for p in values),
+                discord.Color.green(),
+            )
+        )
+
     # --- listbotchannels command ---
 
     @validation.role()
@@ -3,6 +3,7 @@ from discord.ext import commands
 import logging
 import os
 import validation
+from db_indexes import index_report
 
 class Maintenance(commands.Cog):
     
@@ -42,5 +43,23 @@ class Maintenance(commands.Cog):
             await ctx.send(f"▶️ {instance.title()} bot resumed. Back online!")
             logging.info(f"Bot resumed by {ctx.author}")
 
+    @commands.hybrid_command(name="indexreport", help="Shows index usage and queries that still scan whole collections.")
+    @validation.role()
+    async def show_index_report(self, ctx):
+        async with ctx.typing():
+            try:
+                report = await index_report(self.bot.db)
+            except Exception as e:
+                await ctx.send(f"❌ Failed to build index report: {e!r}")
+                return
+
+        embed = discord.Embed(title="📇 Index Report", color=discord.Color.blue())
+        for collection, info in report.items():
+            lines = [f"`{name}` — {ops} ops" for name, ops in info["usage"].items()]
+            for shape in info["collscans"]:
+                lines.append(f"⚠️ COLLSCAN on `{{{shape}}}`")
+            embed.add_field(name=collection, value="\n".join(lines) or "-", inline=False)
+        await ctx.send(embed=embed)
+
 async def setup(bot):
     await bot.add_cog(Maintenance(bot))
@@ -1,19 +1,85 @@
 import discord
 from discord.ext import commands
-from validation import resolve_members, resolve_roles
+from validation import resolve_members, resolve_roles, IndexedMember
 import random
+import asyncio
+import time
 import validation
 
+# discord.py waits out per-route rate limit buckets itself; this cap keeps us
+# from queueing a burst of requests behind the same bucket.
+BULK_CONCURRENCY = 4
+PROGRESS_EDIT_INTERVAL = 2.0
+
+def _member_lines(members: list[discord.Member], maxlen: int = 1024) -> str:
+    text = ""
+    for i, m in enumerate(members):
+        line = f"• {m.display_name}\n"
+        if len(text) + len(line) > maxlen - 20:
+            return text + f"...and {len(members) - i} more"
+        text += line
+    return text.rstrip() or "-"
+
 class RoleManagement(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+
+    async def _apply_role_bulk(self, ctx, role: discord.Role, members: list[discord.Member], adding: bool):
+        """Adds/removes a role for many members concurrently and reports through one status message."""
+        action = "Adding" if adding else "Removing"
+        total = len(members)
+        succeeded, skipped, failed = [], [], []
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        status = await ctx.send(f"⏳ {action} `{role.name}`... 0/{total}")
+        last_edit = time.monotonic()
+
+        async def apply(member: discord.Member):
+            nonlocal last_edit
+            if (member.get_role(role.id) is not None) == adding:
+                skipped.append(member)
+            else:
+                async with semaphore:
+                    try:
+                        if adding:
+                            await member.add_roles(role)
+                        else:
+                            await member.remove_roles(role)
+                        succeeded.append(member)
+                    except discord.HTTPException as e:
+                        failed.append((member, e))
+
+            done = len(succeeded) + len(skipped) + len(failed)
+            now = time.monotonic()
+            if done < total and now - last_edit >= PROGRESS_EDIT_INTERVAL:
+                last_edit = now
+                try:
+                    await status.edit(content=f"⏳ {action} `{role.name}`... {done}/{total}")
+                except discord.HTTPException:
+                    pass
+
+        await asyncio.gather(*(apply(m) for m in members))
+
+        embed = discord.Embed(
+            title=f"🎉 Role `{role.name}` {'added to' if adding else 'removed from'} {len(succeeded)}/{total} users",
+            color=discord.Color.orange() if failed else discord.Color.green(),
+            timestamp=ctx.message.created_at
+        )
+        if succeeded:
+            embed.add_field(name=f"✅ Done ({len(succeeded)})", value=_member_lines(succeeded), inline=False)
+        if skipped:
+            reason = "already had the role" if adding else "did not have the role"
+            embed.add_field(name=f"⏭️ Skipped, {reason} ({len(skipped)})", value=_member_lines(skipped), inline=False)
+        if failed:
+            embed.add_field(name=f"❌ Failed ({len(failed)})", value=_member_lines([m for m, _ in failed]), inline=False)
+            embed.set_footer(text=f"First error: {failed[0][1]}"[:2048])
+        await status.edit(content=None, embed=embed)
     
     @commands.command(name="createrole", aliases=["cr", "makerole"], help="Create a role")
     @validation.role()
     async def createRole(self, ctx, role_name: str, color: str = None):
         guild = ctx.guild
-        existing_role = discord.utils.get(guild.roles, name=role_name)
+        existing_role = self.bot.role_index.for_guild(guild).get(role_name)
 
         if existing_role:
             await ctx.send(f"⚠️ Role `{existing_role.name}` already exists.")
@@ -37,24 +103,20 @@ class RoleManagement(commands.Cog):
     @commands.command(name="deleterole",aliases=["dr","delrole"], help="Delete a role")
     @validation.role()
     async def removeRole(self,ctx, role_name: discord.Role | str):
-        guild = ctx.guild
         if isinstance(role_name, discord.Role):
-            role_name = role_name.name
+            existing_role = role_name
         else:
             role_filter = await resolve_roles(ctx, [role_name])
-            if role_filter:
-                role_name = role_filter[0].name
-
-        existing_role = discord.utils.get(guild.roles, name=role_name)
+            existing_role = role_filter[0] if role_filter else None
 
         if not existing_role:
             await ctx.send(f"⚠️ Role `{role_name}` does not exist.")
             return
         await existing_role.delete()
-        await ctx.send(f"✅ Deleted role `{role_name}`")
+        await ctx.send(f"✅ Deleted role `{existing_role.name}`")
 
     @commands.command(name="listrole",aliases=["lr","roles"], help="List all roles in the server / List user roles")
-    async def listRoles(self,ctx, params : discord.Member | discord.guild.Role | str = None):
+    async def listRoles(self,ctx, params : IndexedMember | discord.guild.Role | str = None):
         guild = ctx.guild
         user = None
         role = None
@@ -122,44 +184,75 @@ class RoleManagement(commands.Cog):
         embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.avatar.url)
         await ctx.send(embed=embed)
 
+    @commands.command(name="modroles", aliases=["modrole"], help="Show or set the roles that count as Moderator (`reset` for default; setting needs Manage Server)")
+    @validation.role()
+    async def moderatorRoles(self, ctx, *roles: discord.Role | str):
+        guild = ctx.guild
+        index = self.bot.role_index.for_guild(guild)
+
+        if not roles:
+            config = await self.bot.config_cache.get(guild.id)
+            configured = config.moderator_roles if config else None
+            mod_roles = [r for r in (guild.get_role(i) for i in index.moderator_ids(configured)) if r]
+            source = "configured" if configured else "default: name contains `Moderator`"
+            lines = "\n".join(f" - {r.mention}" for r in mod_roles) or "(None)"
+            await ctx.send(embed=discord.Embed(title=f"🛡️ Moderator roles ({source})", description=lines, color=discord.Color.dark_gold()))
+            return
+
+        # Changing who counts as Moderator is a server-level setting, not a moderator action
+        if not ctx.author.guild_permissions.manage_guild:
+            await ctx.send("❌ You need the **Manage Server** permission to change moderator roles.")
+            return
+
+        if len(roles) == 1 and roles[0] == "reset":
+            await self.bot.config_cache.update(guild.id, {"$unset": {"moderator_roles": ""}}, upsert=True)
+            await ctx.send("✅ Moderator roles reset to default (name contains `Moderator`).")
+            return
+
+        # Exact mentions, IDs or names only; a prefix match could hand Moderator to the wrong role
+        unknown = [r for r in roles if not isinstance(r, discord.Role)]
+        if unknown:
+            await ctx.send(f"⚠️ Roles not found: {', '.join(f'`{r}`' for r in unknown)} (use a mention, ID or exact name)")
+            return
+        resolved = list(dict.fromkeys(roles))
+        if guild.default_role in resolved:
+            await ctx.send("❌ `@everyone` cannot be a moderator role.")
+            return
+        if not any(ctx.author.get_role(r.id) for r in resolved):
+            await ctx.send("❌ You must keep at least one of the new moderator roles yourself.")
+            return
+
+        await self.bot.config_cache.update(
+            guild.id,
+            {"$set": {"moderator_roles": [str(r.id) for r in resolved]}},
+            upsert=True
+        )
+        await ctx.send(f"✅ Moderator roles set to: {', '.join(f'`{r.name}`' for r in resolved)}")
+
     @commands.command(name="removerole",aliases=["removerolefromuser","rr"], help="Remove a role from users")
     @validation.role()
-    async def removeRoleFromUser(self,ctx, role_name: discord.Role | str ,*user: discord.Member | str):
+    async def removeRoleFromUser(self,ctx, role_name: discord.Role | str ,*user: IndexedMember | str):
         mentioned_members = await resolve_members(ctx, user)
-        guild = ctx.guild
         if isinstance(role_name, discord.Role):
             role = role_name
         else:
             role_filter = await resolve_roles(ctx, [role_name])
-            if role_filter:
-                role_name = role_filter[0].name
-            role = discord.utils.get(guild.roles, name=role_name)
+            role = role_filter[0] if role_filter else None
         if not role:
             await ctx.send(f"⚠️ Role `{role_name}` does not exist.")
             return
         if not mentioned_members:
             await ctx.send("❌ You need to mention at least one user.")
             return
-        for member in mentioned_members:
-            if member.roles and role in member.roles:
-                await member.remove_roles(role)
-                await ctx.send(f"✅ Role `{role.name}` removed from user `{member.display_name}`.")
-            else:
-                await ctx.send(f"⚠️ User `{member.display_name}` does not have the role `{role.name}`.")
-                await ctx.send("⏭️ Skipping to the next user.")
-
-        await ctx.send(f"🎉 Done! Role `{role.name}` removed from all mentioned users.")
+        await self._apply_role_bulk(ctx, role, mentioned_members, adding=False)
 
     @commands.command(name="addrole", aliases=["arole", "ar"], help="Add a role to users")
-    async def addRole(self,ctx, role_name: discord.Role | str,*user: discord.Member | str):
-        guild = ctx.guild
+    async def addRole(self,ctx, role_name: discord.Role | str,*user: IndexedMember | str):
         if isinstance(role_name, discord.Role):
             role = role_name
         else:
             role_filter = await resolve_roles(ctx, [role_name])
-            if role_filter:
-                role_name = role_filter[0].name
-            role = discord.utils.get(guild.roles, name=role_name)
+            role = role_filter[0] if role_filter else None
 
         if not role:
             await ctx.send(f"⚠️ Role `{role_name}` does not exist.")
@@ -170,16 +263,7 @@ class RoleManagement(commands.Cog):
             await ctx.send("❌ You need to mention at least one user.")
             return
 
-        for member in mentioned_members:
-            if member.roles and role in member.roles:
-                await ctx.send(f"⚠️ User `{member.display_name}` already has the role `{role.name}`.")
-                await ctx.send("⏭️ Skipping to the next user.")
-                continue
-            else:
-                await member.add_roles(role)
-                await ctx.send(f"✅ Role `{role.name}` added to user `{member.display_name}`.")
-
-        await ctx.send(f"🎉 Done! Role `{role.name}` added to all mentioned users.")
+        await self._apply_role_bulk(ctx, role, mentioned_members, adding=True)
 
 async def setup(bot : commands.Bot):
     await bot.add_cog(RoleManagement(bot))
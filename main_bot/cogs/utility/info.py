@@ -38,9 +38,11 @@ class Info(commands.Cog):
     @app_commands.describe(command_name="The name of the command you want to check")
     async def help(self, ctx: commands.Context, command_name: str | None = None):
         if command_name is None:
+            prefixes = dict.fromkeys(p.lower() for p in await self.bot.prefixes_for_guild(ctx.guild))
+            prefix_text = " or ".join(f"**`{p}`**" for p in prefixes)
             embed = discord.Embed(
                 title="🤖 Bot Help Menu",
-                description=f"Prefixes: **`b`** or **`t`** (or mention me).\nUse `{ctx.clean_prefix}help <command>` for details.",
+                description=f"Prefixes: {prefix_text} (or mention me).\nUse `{ctx.clean_prefix}help <command>` for details.",
                 color=discord.Color.blurple(),
             )
             if ctx.author.avatar:
@@ -1,5 +1,6 @@
 import discord, re, asyncio
 from discord import ui
+from cache import ScheduleCache
 
 # --- Configuration ---
 DAY_ALIASES = {
@@ -49,22 +50,59 @@ async def _validate_time_room(interaction: discord.Interaction, time: str, room:
     return time, room_final
 
 
-async def get_user_schedule(db_collection, guild_id: int, user_id: int):
-        main_doc = await db_collection.find_one({
-            "guild_id": str(guild_id)
-        })
-        if not main_doc:
-            return None
+async def get_user_schedule(schedules: ScheduleCache, guild_id: int, user_id: int):
+    return await schedules.get(guild_id, user_id)
+
+
+def _merge_legacy_days(legacy: dict) -> dict:
+    """Update that adds a legacy document's subjects without dropping ones already saved under the new layout."""
+    add = {en: {"$each": legacy[en]} for _, en in DAYS_TH_EN if legacy.get(en)}
+    return {"$addToSet": add} if add else {"$setOnInsert": {"user_id": legacy["user_id"]}}
 
-        for wrapper in main_doc.get("schedules", []):
-            if not wrapper:
+
+async def migrate_schedule_layout(db_collection, default_guild_id: str | None):
+    """
+    Moves schedules into per-(guild, user) documents. Safe to re-run and to
+    interrupt: legacy subjects are merged into any document the user already
+    has, and a source document is only deleted after everything in it has
+    been copied.
+
+    Two legacy shapes are handled: guild documents holding every member under
+    `schedules`, and guild-less `{"user_id": ...}` documents written by the
+    old modals (assigned to `default_guild_id`).
+    """
+    moved = 0
+    async for guild_doc in db_collection.find({"schedules": {"$exists": True}}):
+        guild_id = guild_doc.get("guild_id")
+        if guild_id is None:
+            continue
+        for wrapper in guild_doc.get("schedules", []):
+            if not wrapper or wrapper[0].get("user_id") is None:
                 continue
             sched = wrapper[0]
-            if sched.get("user_id") == user_id:
-                print("Found schedule for user:", user_id)
-                return sched
+            await db_collection.update_one(
+                ScheduleCache.key(guild_id, sched["user_id"]),
+                _merge_legacy_days(sched),
+                upsert=True
+            )
+            moved += 1
+        await db_collection.delete_one({"_id": guild_doc["_id"]})
+
+    orphan_filter = {"guild_id": {"$exists": False}, "user_id": {"$exists": True}}
+    if default_guild_id is None:
+        if await db_collection.find_one(orphan_filter, {"_id": 1}):
+            print("⚠️ Schedules without guild_id left in place: GUILD_ID is not set")
+        return moved
+
+    async for doc in db_collection.find(orphan_filter):
+        await db_collection.update_one(ScheduleCache.key(default_guild_id, doc["user_id"]), _merge_legacy_days(doc), upsert=True)
+        await db_collection.delete_one({"_id": doc["_id"]})
+        moved += 1
+
+    if moved:
+        print(f"✅ Migrated {moved} schedules to per-user documents")
+    return moved
 
-        return None
 
 async def generate_options(db, guild_id, user_id):
     doc = await get_user_schedule(db, guild_id, user_id)
@@ -164,10 +202,6 @@ class EditInfoModal(ui.Modal,title="แก้ไขข้อมูลราย
 
         prof = self.prof_input.value.strip()
 
-        filter_ = {
-            "user_id" : interaction.user.id,
-            f"{self.date}.name" : self.subject 
-        }
         update_operation = {
             "$set": {
                 f"{self.date}.$.name": subject,
@@ -177,7 +211,12 @@ class EditInfoModal(ui.Modal,title="แก้ไขข้อมูลราย
             }
         }
         
-        await self.db_collection.update_one(filter_, update_operation)
+        await self.db_collection.update(
+            interaction.guild.id,
+            interaction.user.id,
+            update_operation,
+            extra_filter={f"{self.date}.name": self.subject}
+        )
 
         await interaction.response.send_message(
             f"✅ แก้ไขวิชา **{subject}** \n🗓️ วัน**{DAY_EN_TO_TH.get(self.date)}** เวลา `{time}` ห้อง `{room_final}` \nอาจารย์ `{prof}`",
@@ -242,8 +281,9 @@ class AddClassModal(ui.Modal, title="เพิ่มวิชาในตาร
             "professor" : prof
         }
 
-        await self.db_collection.update_one(
-            {"user_id": interaction.user.id},
+        await self.db_collection.update(
+            interaction.guild.id,
+            interaction.user.id,
             {"$push": {day_en: new_class}},
             upsert=True
         )
@@ -369,8 +409,9 @@ class ConfirmView(ui.View):
 
     @ui.button(label="ยืนยันลบ", style=discord.ButtonStyle.danger, emoji="🗑️")
     async def confirm(self, interaction: discord.Interaction, button: ui.Button):
-        await self.db.update_one(
-            {"user_id": self.user_id},
+        await self.db.update(
+            interaction.guild.id,
+            self.user_id,
             {"$pull": {self.day_key: {"name": self.subject_name,"room": self.subject_room,"professor": self.subject_professor}}}
         )
         
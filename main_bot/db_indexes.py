@@ -0,0 +1,93 @@
+"""
+Index registry for every collection the bot queries.
+
+Each entry mirrors a real query shape; `apply_indexes` is idempotent and
+runs from setup_hook. `QUERY_SHAPES` are sample filters used by the index
+report to check that those shapes are actually served by an index.
+The API keeps its own registry (api/db_indexes.py) for the collections it reads.
+"""
+import asyncio
+
+INDEXES = {
+    "homeworks": [
+        {"keys": [("user_id", 1), ("due_ts", 1)]},
+    ],
+    "schedules": [
+        # One document per (guild, user)
+        {"keys": [("guild_id", 1), ("user_id", 1)]},
+    ],
+    "std_id": [
+        {"keys": [("guild_id", 1), ("user_id", 1)]},
+        {"keys": [("user_id", 1)]},
+    ],
+    "restaurant_choices": [
+        {"keys": [("guild_id", 1)]},
+    ],
+    "authorize_user": [
+        {"keys": [("guild_id", 1), ("user_id", 1)]},
+    ],
+    "exam_cache": [
+        # Tables not refreshed for 30 days are dropped
+        {"keys": [("fetched_at", 1)], "options": {"expireAfterSeconds": 30 * 24 * 3600}},
+    ],
+    "startup_profiles": [
+        {"keys": [("instance", 1), ("started_at", -1)]},
+    ],
+}
+
+QUERY_SHAPES = {
+    "homeworks": [{"user_id": 0}],
+    "schedules": [{"guild_id": "", "user_id": 0}],
+    "std_id": [{"guild_id": ""}, {"user_id": 0}],
+    "restaurant_choices": [{"guild_id": ""}],
+    "authorize_user": [{"guild_id": "", "user_id": ""}],
+}
+
+
+async def _create(db, collection: str, spec: dict) -> bool:
+    try:
+        await db[collection].create_index(spec["keys"], **spec.get("options", {}))
+        return True
+    except Exception as e:
+        print(f"⚠️ Index {collection} {spec['keys']} not created: {e!r}")
+        return False
+
+
+async def apply_indexes(db) -> int:
+    """Creates every registered index concurrently; returns how many failed."""
+    results = await asyncio.gather(*(
+        _create(db, collection, spec)
+        for collection, specs in INDEXES.items()
+        for spec in specs
+    ))
+    return results.count(False)
+
+
+def _plan_stages(plan: dict):
+    yield plan.get("stage")
+    for key in ("inputStage", "queryPlan"):
+        if isinstance(plan.get(key), dict):
+            yield from _plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from _plan_stages(child)
+
+
+async def index_report(db) -> dict:
+    """
+    Per collection: usage counters from $indexStats and the registered
+    query shapes whose winning plan is still a COLLSCAN.
+    """
+    report = {}
+    for collection in INDEXES:
+        usage = {}
+        async for stat in db[collection].aggregate([{"$indexStats": {}}]):
+            usage[stat["name"]] = stat["accesses"]["ops"]
+
+        collscans = []
+        for shape in QUERY_SHAPES.get(collection, []):
+            explain = await db[collection].find(shape).explain()
+            winning = explain.get("queryPlanner", {}).get("winningPlan", {})
+            if "COLLSCAN" in _plan_stages(winning):
+                collscans.append(", ".join(shape))
+        report[collection] = {"usage": usage, "collscans": collscans}
+    return report
@@ -0,0 +1,12 @@
+from .client import (
+    ExamClient,
+    ExamFetchError
+)
+from .cache import (
+    ExamCache,
+    table_hash
+)
+from .parser import (
+    ParsePool,
+    extract_table
+)
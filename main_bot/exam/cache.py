@@ -0,0 +1,152 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from .client import ExamClient
+from .parser import ParsePool
+
+TTL_SEC = int(os.getenv("EXAM_CACHE_TTL_SEC", "3600"))
+MAX_STALE_SEC = int(os.getenv("EXAM_CACHE_MAX_STALE_SEC", "86400"))
+# Consecutive empty pages needed before an empty table replaces a non-empty one
+EMPTY_CONFIRMATIONS = int(os.getenv("EXAM_CACHE_EMPTY_CONFIRMATIONS", "3"))
+MAX_ENTRIES = 2048
+
+Rows = List[List[str]]
+
+
+def table_hash(rows: Rows) -> str:
+    return hashlib.sha256(json.dumps(rows, ensure_ascii=False).encode()).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("rows", "fetched_at", "hash", "empty_streak")
+
+    def __init__(self, rows: Rows, fetched_at: float, hash_: str):
+        self.rows = rows
+        self.fetched_at = fetched_at
+        self.hash = hash_
+        self.empty_streak = 0
+
+
+class ExamCache:
+    """
+    Parsed exam tables keyed by student ID, kept in memory and mirrored to
+    the `exam_cache` collection so a restart does not re-scrape everyone.
+
+    Fresh entries (younger than TTL_SEC) are served directly. Stale ones up
+    to MAX_STALE_SEC are served immediately while a background refresh runs.
+    Anything older waits for the refresh. Concurrent lookups for one ID
+    share a single upstream fetch.
+
+    REG answers 200 with an empty page during outages, so an empty parse
+    only replaces a non-empty table after `empty_confirmations` in a row, or
+    once the cached table is past max_stale; until then the old rows are
+    served and keep their fetched_at.
+    """
+
+    def __init__(self, bot, client: ExamClient, parser: ParsePool, ttl: float = TTL_SEC, max_stale: float = MAX_STALE_SEC,
+                 empty_confirmations: int = EMPTY_CONFIRMATIONS):
+        self.collection = bot.db["exam_cache"]
+        self.client = client
+        self.parser = parser
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.empty_confirmations = empty_confirmations
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _remember(self, std_id: str, entry: _Entry):
+        self._entries[std_id] = entry
+        self._entries.move_to_end(std_id)
+        while len(self._entries) > MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    async def _lookup(self, std_id: str) -> Optional[_Entry]:
+        entry = self._entries.get(std_id)
+        if entry is not None:
+            self._entries.move_to_end(std_id)
+            return entry
+        doc = await self.collection.find_one({"_id": std_id})
+        if doc is None:
+            return None
+        fetched_at = doc["fetched_at"]
+        if fetched_at.tzinfo is None:
+            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+        entry = _Entry(doc["rows"], fetched_at.timestamp(), doc.get("hash", ""))
+        self._remember(std_id, entry)
+        return entry
+
+    async def get(self, std_id: str) -> Rows:
+        entry = await self._lookup(std_id)
+        age = time.time() - entry.fetched_at if entry else None
+
+        if entry is not None and age < self.ttl:
+            self.hits += 1
+            return entry.rows
+        if entry is not None and age < self.max_stale:
+            self.stale_hits += 1
+            self._refresh_task(std_id)
+            return entry.rows
+
+        self.misses += 1
+        rows, _ = await asyncio.shield(self._refresh_task(std_id))
+        return rows
+
+    async def refresh(self, std_id: str) -> Tuple[Rows, bool]:
+        """Scrapes now (joining any fetch already in flight); returns the rows and whether they changed."""
+        return await asyncio.shield(self._refresh_task(std_id))
+
+    def _refresh_task(self, std_id: str) -> asyncio.Task:
+        task = self._inflight.get(std_id)
+        if task is not None:
+            self.coalesced += 1
+            return task
+        task = asyncio.create_task(self._do_refresh(std_id))
+        self._inflight[std_id] = task
+        task.add_done_callback(lambda t: self._finish(std_id, t))
+        return task
+
+    def _finish(self, std_id: str, task: asyncio.Task):
+        self._inflight.pop(std_id, None)
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so background refresh failures are not reported as unhandled
+            print(f"⚠️ Exam refresh for {std_id} failed: {task.exception()!r}")
+
+    async def _do_refresh(self, std_id: str) -> Tuple[Rows, bool]:
+        html = await self.client.fetch(std_id)
+        rows = await self.parser.parse(html)
+        previous = await self._lookup(std_id)
+        now = datetime.now(timezone.utc)
+        if not rows and previous is not None and previous.rows:
+            previous.empty_streak += 1
+            if previous.empty_streak < self.empty_confirmations and now.timestamp() - previous.fetched_at < self.max_stale:
+                return previous.rows, False
+        digest = table_hash(rows)
+        # A table emptying out (semester over) is not worth a DM to the student
+        changed = previous is not None and previous.hash != digest and bool(rows)
+        self._remember(std_id, _Entry(rows, now.timestamp(), digest))
+        await self.collection.update_one(
+            {"_id": std_id},
+            {"$set": {"rows": rows, "hash": digest, "fetched_at": now}},
+            upsert=True
+        )
+        return rows, changed
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+            "entries": len(self._entries),
+        }
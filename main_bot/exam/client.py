@@ -0,0 +1,96 @@
+import asyncio
+import os
+import random
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+MAX_CONCURRENCY = int(os.getenv("EXAM_FETCH_CONCURRENCY", "4"))
+MAX_RETRIES = 2
+BACKOFF_BASE_SEC = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+LATENCY_WINDOW = 200
+
+
+class ExamFetchError(Exception):
+    """REG could not be reached or kept failing after retries."""
+
+
+class ExamClient:
+    """
+    Shared keep-alive HTTP client for the REG exam schedule page.
+
+    One aiohttp session is reused for every lookup, at most MAX_CONCURRENCY
+    requests are in flight toward REG, and connection errors, timeouts and
+    429/5xx responses are retried with jittered backoff.
+    """
+
+    def __init__(self, url: Optional[str] = None, concurrency: int = MAX_CONCURRENCY):
+        self.url = url if url is not None else os.getenv("API_ENDPOINT", "")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so it binds to the running event loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=MAX_CONCURRENCY * 2, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=10, connect=3),
+            )
+        return self._session
+
+    async def fetch(self, std_id: str) -> str:
+        """Returns the raw HTML exam table page for a student ID."""
+        if not self.url:
+            raise ExamFetchError("API_ENDPOINT is not set")
+
+        session = self._get_session()
+        async with self._semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                start = time.perf_counter()
+                self.requests += 1
+                try:
+                    async with session.get(self.url, params={"IDcard": std_id}) as resp:
+                        if resp.status not in RETRY_STATUSES:
+                            resp.raise_for_status()
+                            body = await resp.text(encoding="utf-8")
+                            self._latencies.append(time.perf_counter() - start)
+                            return body
+                        error: Exception = ExamFetchError(f"REG responded {resp.status}")
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    error = e
+                except aiohttp.ClientResponseError as e:
+                    self.failures += 1
+                    raise ExamFetchError(f"REG responded {e.status}") from e
+
+                if attempt == MAX_RETRIES:
+                    self.failures += 1
+                    raise ExamFetchError(f"REG unavailable: {error!r}") from error
+                self.retries += 1
+                await asyncio.sleep(BACKOFF_BASE_SEC * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+
+        def pct(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 1)
+
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "latency_ms_p50": pct(0.5),
+            "latency_ms_p95": pct(0.95),
+        }
@@ -0,0 +1,59 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+PARSE_WORKERS = int(os.getenv("EXAM_PARSE_WORKERS", "2"))
+MAX_PENDING = int(os.getenv("EXAM_PARSE_MAX_PENDING", "16"))
+
+
+def _best_parser() -> str:
+    """lxml when installed (several times faster on large tables), else the stdlib parser."""
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+PARSER = _best_parser()
+
+
+def extract_table(html: str, parser: Optional[str] = None) -> List[List[str]]:
+    """Text of every non-empty table row in the REG page; the first row is the header."""
+    # Imported on first use so it is not paid for at startup
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, parser or PARSER)
+    rows = []
+    for tr in soup.find_all("tr"):
+        cols = [td.get_text(strip=True) for td in tr.find_all(["td", "th"])]
+        if cols:
+            rows.append(cols)
+    return rows
+
+
+class ParsePool:
+    """
+    Runs `extract_table` off the event loop.
+
+    At most `max_pending` pages are queued or parsing at once; further
+    callers wait for a slot instead of piling work onto the executor.
+    Threads rather than processes: main.py starts the bot at import time,
+    so spawn/forkserver workers would re-run it, and forking a process that
+    holds Motor's threads is unsafe.
+    """
+
+    def __init__(self, workers: int = PARSE_WORKERS, max_pending: int = MAX_PENDING):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="exam-parse")
+        self._slots = asyncio.Semaphore(max_pending)
+        self.parsed = 0
+
+    async def parse(self, html: str) -> List[List[str]]:
+        async with self._slots:
+            rows = await asyncio.get_running_loop().run_in_executor(self._executor, extract_table, html)
+        self.parsed += 1
+        return rows
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,203 @@
+import ast
+import asyncio
+import glob
+import os
+
+from discord.ext import commands
+
+# Extensions that must be imported at startup even if they look deferrable,
+# e.g. cogs that start background tasks in cog_load.
+EAGER_EXTENSIONS = {
+    "cogs.backup.backup_",
+}
+
+# Any decorator whose dotted name contains one of these needs the real cog
+# registered before on_ready (app commands are synced at startup, listeners
+# and tasks have to be running), so such extensions are never deferred.
+_STARTUP_DECORATORS = ("hybrid", "app_commands", "listener", "tasks.loop", "group")
+
+
+def _module_name(path: str) -> str:
+    return path[:-3].replace(os.sep, ".")
+
+
+def _literal(node: ast.expr):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return ast.unparse(node)
+
+
+def _signature(func: ast.AsyncFunctionDef, require_var_positional: bool = False) -> str:
+    """
+    Command.signature text for a prefix command, rebuilt from its source so
+    a stub shows the real parameters in help. Follows discord.py's rules
+    for defaults, Optional, Greedy and *args.
+    """
+    args = func.args
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    # Skip self and ctx
+    params = list(zip(positional, defaults))[2:]
+    if args.vararg:
+        params.append((args.vararg, None))
+    params += list(zip(args.kwonlyargs, args.kw_defaults))
+
+    result = []
+    for arg, default in params:
+        name = arg.arg
+        annotation = ast.unparse(arg.annotation) if arg.annotation else ""
+        greedy = "Greedy" in annotation
+        if default is not None:
+            value = _literal(default) if isinstance(default, ast.Constant) else None
+            shown = f"[{name}={value}]" if value not in (None, "") else f"[{name}]"
+            result.append(shown + ("..." if greedy else ""))
+        elif arg is args.vararg:
+            result.append(f"<{name}...>" if require_var_positional else f"[{name}...]")
+        elif greedy:
+            result.append(f"[{name}]...")
+        elif annotation.startswith("Optional[") or "None" in (part.strip() for part in annotation.split("|")):
+            result.append(f"[{name}]")
+        else:
+            result.append(f"<{name}>")
+    return " ".join(result)
+
+
+def scan_extension(path: str) -> tuple[str, list[dict]] | None:
+    """
+    Reads the cog source without importing it and returns the cog name and
+    its prefix command specs, or None when the extension cannot be deferred.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    cogs = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(ast.unparse(base).endswith("Cog") for base in node.bases):
+            continue
+        specs = []
+        for item in node.body:
+            if not isinstance(item, ast.AsyncFunctionDef):
+                continue
+            for deco in item.decorator_list:
+                func = deco.func if isinstance(deco, ast.Call) else deco
+                dotted = ast.unparse(func)
+                if any(marker in dotted for marker in _STARTUP_DECORATORS):
+                    return None
+                if dotted != "commands.command":
+                    continue
+                try:
+                    kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in deco.keywords}
+                except ValueError:
+                    return None
+                specs.append({
+                    "name": kwargs.get("name", item.name),
+                    "aliases": kwargs.get("aliases", []),
+                    "help": kwargs.get("help"),
+                    "hidden": kwargs.get("hidden", False),
+                    "usage": kwargs.get("usage") or _signature(item, kwargs.get("require_var_positional", False)),
+                })
+        cogs.append((node.name, specs))
+
+    if len(cogs) != 1 or not cogs[0][1]:
+        return None
+    return cogs[0]
+
+
+class _DeferredCommand(commands.Command):
+    """
+    Stands in for a command of a deferred extension. It skips its own
+    prepare() (checks, argument parsing) because the real command runs
+    both on the same context once the extension is loaded.
+    """
+
+    async def invoke(self, ctx: commands.Context, /) -> None:
+        await self.callback(self.cog, ctx)
+
+
+class ExtensionLoader:
+    """
+    Loads cog extensions at startup.
+
+    Extensions that only define prefix commands are deferred: a placeholder
+    cog with the same name registers stub commands carrying the real usage
+    text, and the first invocation of any stub imports the real extension
+    and hands the same context to the real command.
+    Everything else is loaded concurrently so I/O in `setup`/`cog_load`
+    overlaps.
+    """
+
+    def __init__(self, bot: commands.Bot, lazy: bool = True):
+        self.bot = bot
+        self.lazy = lazy
+        self.deferred: dict[str, str] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def load_all(self, pattern: str = "cogs/**/*.py", exclude: list[str] | None = None):
+        exclude = exclude or []
+        eager = []
+        for path in glob.glob(pattern, recursive=True):
+            base = os.path.basename(path)
+            if base.startswith("_") or any(i in exclude for i in base.split("/")):
+                continue
+            module = _module_name(path)
+            spec = None
+            if self.lazy and module not in EAGER_EXTENSIONS:
+                spec = scan_extension(path)
+            if spec is None:
+                eager.append(module)
+            else:
+                await self._defer(module, *spec)
+
+        await asyncio.gather(*(self.bot.load_extension(m) for m in eager))
+        if self.deferred:
+            print(f"💤 Deferred extensions: {', '.join(sorted(self.deferred))}")
+
+    async def _defer(self, module: str, cog_name: str, specs: list[dict]):
+        attrs = {}
+        for i, spec in enumerate(specs):
+            attrs[f"stub_{i}"] = self._make_stub(module, spec)
+        placeholder = type(cog_name, (commands.Cog,), attrs)
+        await self.bot.add_cog(placeholder())
+        self.deferred[module] = cog_name
+
+    def _make_stub(self, module: str, spec: dict) -> commands.Command:
+        loader = self
+
+        async def stub(self, ctx: commands.Context):
+            await loader.ensure_loaded(module)
+            # Same context, view still right after the invoker: the real command
+            # parses the arguments and runs the checks, and bot.invoke reports
+            # its errors and completion once, as for any other command
+            await loader.bot.get_command(spec["name"]).invoke(ctx)
+
+        return commands.command(
+            cls=_DeferredCommand,
+            name=spec["name"],
+            aliases=spec["aliases"],
+            help=spec["help"],
+            hidden=spec["hidden"],
+            usage=spec["usage"],
+        )(stub)
+
+    async def ensure_loaded(self, module: str):
+        lock = self._locks.setdefault(module, asyncio.Lock())
+        async with lock:
+            cog_name = self.deferred.get(module)
+            if cog_name is None:
+                return
+            placeholder = await self.bot.remove_cog(cog_name)
+            try:
+                await self.bot.load_extension(module)
+            except Exception:
+                await self.bot.add_cog(placeholder)
+                raise
+            del self.deferred[module]
+            print(f"✅ Lazily loaded {module}")
+
+    async def load_deferred(self):
+        """Loads every deferred extension now, e.g. before a reload or shutdown hook."""
+        for module in list(self.deferred):
+            await self.ensure_loaded(module)
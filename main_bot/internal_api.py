@@ -1,58 +1,92 @@
-from flask import Flask, jsonify, request
-from threading import Thread
-from waitress import serve
+from aiohttp import web
 import os
+import time
 import asyncio
+import discord
 
-app = Flask('Bot')
-bot_instance = None 
+FETCH_TIMEOUT_SEC = 5
+FETCH_CONCURRENCY = 5
+MAX_BATCH_IDS = 100
+NEGATIVE_CACHE_TTL_SEC = 300
 
-def set_bot(bot):
-    """Set the bot instance so Flask can check its status"""
-    global bot_instance
-    bot_instance = bot
+BOT_KEY = web.AppKey("bot", object)
+MISSING_KEY = web.AppKey("missing_channels", dict)
+routes = web.RouteTableDef()
 
 
-def run():
+async def start_internal_api(bot) -> web.AppRunner:
+    """Serve the internal API from the bot's own event loop."""
+    app = web.Application()
+    app[BOT_KEY] = bot
+    app[MISSING_KEY] = {}
+    app.add_routes(routes)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
     port = int(os.environ.get('PORT', 8080))
-    serve(app,host='0.0.0.0', port=port)
-
-def keep_alive():
-    t = Thread(target=run)
-    t.start()
-
-
-@app.route('/',methods=['GET'])
-def home():
-    return jsonify({"message": "Bot is running", "instance": os.getenv("INSTANCE")}), 200
-
-@app.route('/commands',methods=['GET'])
-def get_commands():
-    if not bot_instance:
-        return jsonify({"error": "Bot instance not ready"}), 503
-        
-    commands_list = []
-    for command in bot_instance.commands:
-        commands_list.append({
-            "name": command.name,
-            "description": command.help or "No description",
-            "aliases": command.aliases,
-            "hidden": command.hidden,
-            "cog": command.cog_name,
-            "enabled": command.enabled
-        })
-    return jsonify({"commands": commands_list}), 200
+    await web.TCPSite(runner, host='0.0.0.0', port=port).start()
+    print(f"✅ Internal API listening on port {port}")
+    return runner
+
+
+def _json(data, status: int = 200) -> web.Response:
+    return web.json_response(data, status=status)
+
+
+def _target_guild(request: web.Request):
+    guild_id = os.getenv("GUILD_ID")
+    if not guild_id:
+        return None, _json({"error": "GUILD_ID not set"}, 500)
+    guild = request.app[BOT_KEY].get_guild(int(guild_id))
+    if not guild:
+        return None, _json({"error": "Guild not found"}, 404)
+    return guild, None
+
+
+async def _resolve_channel(request: web.Request, guild: discord.Guild, channel_id: int, semaphore: asyncio.Semaphore):
+    """Cache first, then a REST fetch; IDs Discord reports as unknown are negatively cached."""
+    channel = guild.get_channel(channel_id) or guild.get_thread(channel_id)
+    if channel:
+        return channel
+
+    missing = request.app[MISSING_KEY]
+    expires = missing.get(channel_id)
+    if expires is not None:
+        if expires > time.monotonic():
+            return None
+        del missing[channel_id]
+
+    async with semaphore:
+        try:
+            return await asyncio.wait_for(guild.fetch_channel(channel_id), timeout=FETCH_TIMEOUT_SEC)
+        except (discord.NotFound, discord.Forbidden):
+            missing[channel_id] = time.monotonic() + NEGATIVE_CACHE_TTL_SEC
+        except Exception as e:
+            print(f"Failed to fetch channel {channel_id}: {e}")
+    return None
+
+
+@routes.get('/')
+async def home(request: web.Request):
+    return _json({"message": "Bot is running", "instance": os.getenv("INSTANCE")})
 
+@routes.get('/commands')
+async def get_commands(request: web.Request):
+    return _json(request.app[BOT_KEY].command_catalog)
 
-@app.route('/is_ready', methods=['GET'])
-def is_ready():
-    ready = bot_instance.is_ready() if bot_instance else False
-    return jsonify({"is_ready": ready}), 200
+@routes.get('/commands/version')
+async def get_commands_version(request: web.Request):
+    """Cheap revalidation for the dashboard API's cached command list."""
+    return _json({"version": request.app[BOT_KEY].command_catalog["version"]})
 
-@app.route('/guilds', methods=['GET'])
-def get_guilds():
-    if not bot_instance:
-        return jsonify({"error": "Bot instance not ready"}), 503
+
+@routes.get('/is_ready')
+async def is_ready(request: web.Request):
+    return _json({"is_ready": request.app[BOT_KEY].is_ready()})
+
+@routes.get('/guilds')
+async def get_guilds(request: web.Request):
+    bot_instance = request.app[BOT_KEY]
     guilds_list = []
     for guild in bot_instance.guilds:
         guilds_list.append({
@@ -62,39 +96,66 @@ def get_guilds():
             "members": guild.member_count,
             "region": str(guild.preferred_locale)
         })
-    return jsonify({"guilds": guilds_list}), 200
-
-@app.route('/channel_name',methods=['GET'])
-def get_channel_name():
-    id = request.args.get('id')
-    if not id:
-         return jsonify({"error": "Missing id parameter"}), 400
-         
-    if not bot_instance:
-        return jsonify({"error": "Bot instance not ready"}), 503
-    
-    guild_id = os.getenv("GUILD_ID")
-    if not guild_id:
-        return jsonify({"error": "GUILD_ID not set"}), 500
-        
-    guild = bot_instance.get_guild(int(guild_id))
-    if not guild:
-        return jsonify({"error": "Guild not found"}), 404
-        
-    channel = guild.get_channel(int(id)) or guild.get_thread(int(id))
+    return _json({"guilds": guilds_list})
 
+@routes.get('/channel_name')
+async def get_channel_name(request: web.Request):
+    id = request.query.get('id')
+    if not id or not id.isdigit():
+        return _json({"error": "Missing id parameter"}, 400)
+
+    guild, error = _target_guild(request)
+    if error:
+        return error
+
+    channel = await _resolve_channel(request, guild, int(id), asyncio.Semaphore(1))
     if not channel:
-        try:
-             future = asyncio.run_coroutine_threadsafe(guild.fetch_channel(int(id)), bot_instance.loop)
-             channel = future.result(timeout=5)
-        except Exception as e:
-             message = f"Failed to fetch channel {id}: {e}"
-             print(message)
-    
-    if not channel:
-        return jsonify({"error": "Channel not found"}), 404
-    return jsonify({"name": channel.name}), 200
+        return _json({"error": "Channel not found"}, 404)
+    return _json({"name": channel.name})
+
+@routes.get('/channel_names')
+async def get_channel_names(request: web.Request):
+    """Resolve many channel IDs at once: ?ids=1,2,3 -> {"channels": {id: {name, type, exists}}}"""
+    ids = list(dict.fromkeys(i.strip() for i in request.query.get('ids', '').split(',') if i.strip().isdigit()))
+    if not ids:
+        return _json({"error": "Missing ids parameter"}, 400)
+    if len(ids) > MAX_BATCH_IDS:
+        return _json({"error": f"At most {MAX_BATCH_IDS} ids per request"}, 400)
+
+    guild, error = _target_guild(request)
+    if error:
+        return error
+
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    channels = await asyncio.gather(*(_resolve_channel(request, guild, int(i), semaphore) for i in ids))
+
+    result = {}
+    for channel_id, channel in zip(ids, channels):
+        if channel is None:
+            result[channel_id] = {"name": None, "type": None, "exists": False}
+        else:
+            result[channel_id] = {"name": channel.name, "type": str(channel.type), "exists": True}
+    return _json({"channels": result})
+
+@routes.get('/snapshot')
+async def get_snapshot(request: web.Request):
+    """Readiness plus guild overview in one precomputed body."""
+    return web.Response(text=request.app[BOT_KEY].snapshot.body(), content_type='application/json')
+
+@routes.get('/cache_stats')
+async def cache_stats(request: web.Request):
+    bot_instance = request.app[BOT_KEY]
+    return _json({
+        "guild_config": bot_instance.config_cache.stats(),
+        "schedules": bot_instance.schedule_cache.stats(),
+        "exam_client": bot_instance.exam_client.stats(),
+        "exam_cache": bot_instance.exam_cache.stats()
+    })
+
+@routes.get('/startup')
+async def startup_profile(request: web.Request):
+    return _json(request.app[BOT_KEY].profiler.report())
 
-@app.route('/status', methods=['GET'])
-def status():
-    return jsonify({"status": "running"}), 200
\ No newline at end of file
+@routes.get('/status')
+async def status(request: web.Request):
+    return _json({"status": "running"})
@@ -1,6 +1,18 @@
+import os, sys
+from startup_profiler import StartupProfiler
+profiler = StartupProfiler(
+    profile_imports="--profile-startup" in sys.argv or os.getenv("PROFILE_STARTUP") == "1"
+)
+
 from discord.activity import Game
-import os, glob, logging, discord , random
+import logging, discord , random, json, hashlib
+from datetime import datetime, timezone
 import validation
+from cache import GuildConfigCache, MemberIndex, RoleIndex, BotSnapshot, ScheduleCache, expand_prefixes
+from extension_loader import ExtensionLoader
+from db_indexes import apply_indexes
+from exam import ExamClient, ExamCache, ParsePool
+from internal_api import start_internal_api
 from discord.ext import commands
 from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -18,15 +30,10 @@ intents.message_content = True
 intents.members = True
 
 TARGET_PREFIXES = ["b", "t"]
+DEFAULT_PREFIXES = expand_prefixes(TARGET_PREFIXES)
 
 async def get_case_insensitive_prefix(bot, message: discord.Message):
-    prefixes = []
-    prefixes += [*commands.when_mentioned(bot, message)]
-
-    for p in TARGET_PREFIXES:
-        prefixes += [p, p.upper()]
-
-    return prefixes
+    return list(await bot.prefixes_for(message))
 
 class Mongo:
     def __init__(self, uri: str, db_name: str):
@@ -103,14 +110,83 @@ class BotInitDB(commands.Bot):
             raise RuntimeError("Missing TOKEN or MONGO_URI")
 
         self.is_paused = False
+        self.internal_api = None
+        self._mention_prefixes: tuple[str, ...] = ()
+        self._command_words: frozenset[str] | None = None
+        self._command_catalog: dict | None = None
+        self.profiler = profiler
         self.mongo = Mongo(MONGO_URI, MONGO_DB)
         self.db = self.mongo.db
+        self.config_cache = GuildConfigCache(self)
+        self.member_index = MemberIndex(self)
+        self.role_index = RoleIndex(self)
+        self.snapshot = BotSnapshot(self)
+        self.schedule_cache = ScheduleCache(self)
+        self.exam_client = ExamClient()
+        self.exam_parser = ParsePool()
+        self.exam_cache = ExamCache(self, self.exam_client, self.exam_parser)
+        self.extension_loader = ExtensionLoader(self, lazy=os.getenv("LAZY_EXTENSIONS", "1") != "0")
         self.instance = ("Server" if os.getenv("INSTANCE") == "Server" else "Dev").lower()
         self.add_check(self.check_maintenance_mode)
         self.add_check(validation.channel)
 
         print("✅ Mongo connected" if self.db is not None else "❌ Mongo failed")
     
+    async def prefixes_for_guild(self, guild: discord.Guild | None) -> tuple[str, ...]:
+        """The guild's prefix override from guild_config, or the default prefixes."""
+        if guild is not None:
+            config = await self.config_cache.get(guild.id)
+            if config is not None and config.prefixes:
+                return config.prefixes
+        return DEFAULT_PREFIXES
+
+    async def prefixes_for(self, message: discord.Message) -> tuple[str, ...]:
+        if not self._mention_prefixes and self.user is not None:
+            self._mention_prefixes = (f"<@{self.user.id}> ", f"<@!{self.user.id}> ")
+        return self._mention_prefixes + await self.prefixes_for_guild(message.guild)
+
+    @property
+    def command_words(self) -> frozenset[str]:
+        """Lowercase names and aliases of every top-level command."""
+        if self._command_words is None:
+            self._command_words = frozenset(name.lower() for name in self.all_commands)
+        return self._command_words
+
+    @property
+    def command_catalog(self) -> dict:
+        """Prefix command listing served to the dashboard, with a content version for ETags."""
+        if self._command_catalog is None:
+            commands_list = [{
+                "name": command.name,
+                "description": command.help or "No description",
+                "aliases": command.aliases,
+                "hidden": command.hidden,
+                "cog": command.cog_name,
+                "enabled": command.enabled
+            } for command in self.commands]
+            raw = json.dumps(commands_list, sort_keys=True)
+            version = hashlib.sha256(raw.encode()).hexdigest()[:16]
+            self._command_catalog = {"commands": commands_list, "version": version}
+        return self._command_catalog
+
+    async def on_message(self, message: discord.Message):
+        # Cheap rejection before discord.py builds a full Context for every chat message
+        if message.author.bot:
+            return
+        if isinstance(message.channel, discord.Thread) and message.channel.me is None:
+            return
+
+        content = message.content
+        prefix = next((p for p in await self.prefixes_for(message) if content.startswith(p)), None)
+        if prefix is None:
+            return
+        rest = content[len(prefix):]
+        word = rest.split(None, 1)[0].lower() if rest and not rest[0].isspace() else ""
+        if word not in self.command_words:
+            return
+
+        await self.process_commands(message)
+
     async def check_maintenance_mode(self, ctx):
         if not self.is_paused:
             return True
@@ -142,19 +218,62 @@ class BotInitDB(commands.Bot):
             
     async def setup_hook(self):
         print("Starting Setup Hook...")
-        await self.mongo.pingdb()
-        await self.add_cog(Core(self))
-        await self._load_all_extensions() 
+        with profiler.phase("mongo_ping"):
+            await self.mongo.pingdb()
+        with profiler.phase("ensure_indexes"):
+            await apply_indexes(self.db)
+        with profiler.phase("load_extensions"):
+            await self.add_cog(Core(self))
+            await self._load_all_extensions() 
+        with profiler.phase("guild_config_warm"):
+            await self.config_cache.warm()
 
+        with profiler.phase("tree_sync"):
+            await self._sync_app_commands()
+        with profiler.phase("refactor_db"):
+            await self.refactor_db()
+
+    def _app_command_hash(self, guild: discord.abc.Snowflake | None, scope: str) -> str:
+        """Stable hash of what tree.sync would upload for this scope."""
+        payload = [c.to_dict(self.tree) for c in self.tree.get_commands(guild=guild)]
+        payload.sort(key=lambda c: (c.get("type", 1), c["name"]))
+        raw = json.dumps({"scope": scope, "commands": payload}, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def _sync_app_commands(self):
+        """
+        Syncs the app command tree only when its hash differs from the one
+        stored for this instance. Set FORCE_TREE_SYNC=1 or pass --force-sync
+        to always sync.
+        """
+        target_guild = None
+        scope = "global"
         if os.getenv("ENV") == "SINGLE_GUILD":
             target_guild = discord.Object(id=GUILD_ID)
             self.tree.copy_global_to(guild=target_guild)
-            await self.tree.sync(guild=target_guild)
-            
+            scope = str(GUILD_ID)
+
+        digest = self._app_command_hash(target_guild, scope)
+        collection = self.db["app_command_sync"]
+        key = f"{self.instance}:{self.application_id}:{scope}"
+        stored = await collection.find_one({"_id": key})
+        force = os.getenv("FORCE_TREE_SYNC") == "1" or "--force-sync" in sys.argv
+
+        if not force and stored and stored.get("hash") == digest:
+            print(f"⏭️ App commands unchanged ({scope}), skipping tree sync")
+            return
+
+        reason = "forced" if force else ("first sync" if not stored else "tree changed")
+        if target_guild is None:
+            print(f"🌍 Production Mode: Syncing Globally... ({reason})")
         else:
-            print("🌍 Production Mode: Syncing Globally...")
-            await self.tree.sync()
-        await self.refactor_db()
+            print(f"🏠 Syncing to guild {scope}... ({reason})")
+        await self.tree.sync(guild=target_guild)
+        await collection.update_one(
+            {"_id": key},
+            {"$set": {"hash": digest, "synced_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
 
     async def on_ready(self):
         guild = self.get_guild(GUILD_ID)
@@ -164,26 +283,49 @@ class BotInitDB(commands.Bot):
             print("⚠️ Guild not found in cache. Are you sure GUILD_ID is correct?")
         print(f"{self.user} has connected to Discord!")
 
+        if profiler.mark_ready():
+            profiler.dump()
+            try:
+                await self.db["startup_profiles"].insert_one({"instance": self.instance, **profiler.report()})
+            except Exception as e:
+                print(f"⚠️ Failed to store startup profile: {e!r}")
+
+    async def load_extension(self, name, *, package=None):
+        with profiler.extension(name):
+            await super().load_extension(name, package=package)
+
+    async def add_cog(self, cog, /, **kwargs):
+        await super().add_cog(cog, **kwargs)
+        self._command_words = None
+        self._command_catalog = None
+        self.config_cache.rebuild_command_index()
+
+    async def remove_cog(self, name, /, **kwargs):
+        cog = await super().remove_cog(name, **kwargs)
+        self._command_words = None
+        self._command_catalog = None
+        self.config_cache.rebuild_command_index()
+        return cog
+
+    async def start(self, token: str, *, reconnect: bool = True):
+        # Bring the internal API up before login so the dashboard sees "starting" instead of "offline"
+        self.internal_api = await start_internal_api(self)
+        await super().start(token, reconnect=reconnect)
+
     async def close(self):
+        self.config_cache.stop()
+        if self.internal_api is not None:
+            await self.internal_api.cleanup()
+        await self.exam_client.close()
+        self.exam_parser.shutdown()
         await self.mongo.close()
         await super().close()
 
     async def _load_all_extensions(self, exclude: list[str] | None = None):
-        exclude = exclude or []
-        paths = glob.glob("cogs/**/*.py", recursive=True)
-        for path in paths:
-            base = os.path.basename(path)
-            if base.startswith("_") or any(i in exclude for i in base.split("/")):
-                continue
-            mod = path[:-3].replace(os.sep, ".")
-            await self.load_extension(mod)
+        await self.extension_loader.load_all("cogs/**/*.py", exclude=exclude)
 
 
 # ------------ run -----------
-from internal_api import keep_alive, set_bot
-
 Bot = BotInitDB()
-set_bot(Bot)
-keep_alive()
 log_level_shift = logging.ERROR if bool(os.getenv("DEV")) == True else logging.DEBUG
 Bot.run(TOKEN, log_handler=handler, log_level=log_level_shift)
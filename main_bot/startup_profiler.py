@@ -0,0 +1,109 @@
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+TOP_IMPORTS = 25
+
+
+class StartupProfiler:
+    """
+    Records how long each boot phase takes: setup_hook steps, every
+    load_extension call and the time until on_ready.
+
+    With `profile_imports` it also times every first-time module import
+    (inclusive of the modules it pulls in), similar to `python -X importtime`.
+    """
+
+    def __init__(self, profile_imports: bool = False):
+        self.started_at = datetime.now(timezone.utc)
+        self._t0 = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.extensions: dict[str, float] = {}
+        self.import_times: dict[str, float] = {}
+        self.time_to_ready: float | None = None
+        self._last_phase_end = self._t0
+        self.profile_imports = profile_imports
+        self._original_import = None
+        if profile_imports:
+            self._install_import_timer()
+
+    def _since_start(self) -> float:
+        return time.perf_counter() - self._t0
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last_phase_end = time.perf_counter()
+            self.phases[name] = round(self._last_phase_end - start, 4)
+
+    @contextmanager
+    def extension(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.extensions[name] = round(time.perf_counter() - start, 4)
+
+    def mark_ready(self) -> bool:
+        """Stores time-to-ready on the first on_ready only; returns True that time."""
+        if self.time_to_ready is not None:
+            return False
+        self.time_to_ready = round(self._since_start(), 4)
+        # Login, gateway connect and member chunking all happen between setup_hook and on_ready
+        self.phases["gateway_connect_and_chunk"] = round(time.perf_counter() - self._last_phase_end, 4)
+        self._uninstall_import_timer()
+        return True
+
+    # --- import timing (--profile-startup) ---
+
+    def _install_import_timer(self):
+        original = self._original_import = builtins.__import__
+        import_times = self.import_times
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            start = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                import_times.setdefault(name, round(time.perf_counter() - start, 4))
+
+        builtins.__import__ = timed_import
+
+    def _uninstall_import_timer(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def top_imports(self, limit: int = TOP_IMPORTS) -> list[tuple[str, float]]:
+        return sorted(self.import_times.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+
+    def dump(self):
+        print("⏱️ Startup profile")
+        for name, sec in self.phases.items():
+            print(f"   {name:<40} {sec * 1000:>9.1f} ms")
+        for name, sec in self.extensions.items():
+            print(f"   load {name:<35} {sec * 1000:>9.1f} ms")
+        if self.time_to_ready is not None:
+            print(f"   {'time to ready':<40} {self.time_to_ready * 1000:>9.1f} ms")
+        if self.profile_imports:
+            print("⏱️ Slowest imports (cumulative)")
+            for name, sec in self.top_imports():
+                print(f"   {name:<40} {sec * 1000:>9.1f} ms")
+
+    def report(self) -> dict:
+        report = {
+            "started_at": self.started_at.isoformat(),
+            "phases": self.phases,
+            "extensions": self.extensions,
+            "time_to_ready": self.time_to_ready,
+        }
+        if self.profile_imports:
+            report["imports"] = dict(self.top_imports())
+        return report
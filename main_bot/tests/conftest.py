@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Bot modules import each other relative to main_bot/, as when run from there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,86 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from exam.cache import ExamCache, table_hash
+
+ROWS = [["Code", "Date"], ["CS101", "1 Mar"]]
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = {}
+
+    async def find_one(self, query):
+        return self.docs.get(query["_id"])
+
+    async def update_one(self, query, update, upsert=False):
+        self.docs.setdefault(query["_id"], {"_id": query["_id"]}).update(update["$set"])
+
+
+class FakeBot:
+    def __init__(self):
+        self.db = {"exam_cache": FakeCollection()}
+
+
+class FakeClient:
+    html = ""
+
+    async def fetch(self, std_id):
+        return self.html
+
+
+class FakeParser:
+    rows = []
+
+    async def parse(self, html):
+        return self.rows
+
+
+def make_cache(rows, age, **kwargs):
+    bot = FakeBot()
+    fetched_at = datetime.now(timezone.utc) - timedelta(seconds=age)
+    bot.db["exam_cache"].docs["1"] = {"_id": "1", "rows": rows, "hash": table_hash(rows), "fetched_at": fetched_at}
+    parser = FakeParser()
+    return ExamCache(bot, FakeClient(), parser, ttl=60, max_stale=3600, **kwargs), parser
+
+
+def test_empty_page_keeps_previous_rows_until_confirmed():
+    cache, parser = make_cache(ROWS, age=120, empty_confirmations=3)
+    parser.rows = []
+
+    async def run():
+        for _ in range(2):
+            assert await cache.refresh("1") == (ROWS, False)
+        assert cache.collection.docs["1"]["rows"] == ROWS
+        entry = cache._entries["1"]
+        assert time.time() - entry.fetched_at >= 120
+        # Third empty page in a row is accepted, without reporting a change
+        assert await cache.refresh("1") == ([], False)
+        assert cache.collection.docs["1"]["rows"] == []
+
+    asyncio.run(run())
+
+
+def test_empty_page_accepted_past_max_stale():
+    cache, parser = make_cache(ROWS, age=7200, empty_confirmations=3)
+    parser.rows = []
+
+    async def run():
+        assert await cache.get("1") == []
+
+    asyncio.run(run())
+
+
+def test_non_empty_page_resets_empty_streak():
+    cache, parser = make_cache(ROWS, age=120, empty_confirmations=2)
+
+    async def run():
+        parser.rows = []
+        assert await cache.refresh("1") == (ROWS, False)
+        parser.rows = ROWS + [["CS102", "2 Mar"]]
+        assert await cache.refresh("1") == (parser.rows, True)
+        parser.rows = []
+        assert await cache.refresh("1") == (ROWS + [["CS102", "2 Mar"]], False)
+
+    asyncio.run(run())
@@ -6,5 +6,6 @@ from .channel_handler import (
     global_channel_check as channel
 )
 from .user_handler import (
-    resolve_members
+    resolve_members,
+    IndexedMember
     )
\ No newline at end of file
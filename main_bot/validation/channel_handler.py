@@ -13,29 +13,16 @@ async def global_channel_check(ctx: commands.Context) -> bool:
     if ctx.command is None:
         return True
 
-    if ctx.command.name in ["command-add"
-                        , "channel-configure"
-                        , "channel-remove"
-                        , "channel-list"
-                        , "help"
-                        , "command-allow-all"
-                        ] or (ctx.command.cog_name and ctx.command.cog_name in ["Core", "Maintenance", "Info"]):
+    cache = ctx.bot.config_cache
+    command_name = ctx.command.qualified_name
+    if command_name in cache.exempt:
         return True
     
-    collection = ctx.bot.db["guild_config"]
-    doc = await collection.find_one({"_id": str(ctx.guild.id)})
-    if not doc:
+    config = await cache.get(ctx.guild.id)
+    if config is None or not config.restricted:
         return True
 
-    if doc.get("mode", "all") == "all":
-        return True
-
-    allowed_channels = doc.get("allowed_channels", [])
-
-    chan_cfg = next(
-        (c for c in allowed_channels if c.get("channel_id") == str(ctx.channel.id)),
-        None,
-    )
+    chan_cfg = config.channels.get(str(ctx.channel.id))
     if chan_cfg is None:
         await ctx.send(
             embed=discord.Embed(
@@ -46,18 +33,13 @@ async def global_channel_check(ctx: commands.Context) -> bool:
         )
         return False
 
-    cmd_mode = chan_cfg.get("cmd_mode", "all")
-    command_list = chan_cfg.get("allowed_commands", []) or []
-
-
-    cmd_names = [ctx.command.qualified_name, *ctx.command.aliases]
-
+    cmd_mode, command_set = chan_cfg
 
     if cmd_mode == "all":
         return True
 
     if cmd_mode == "only":
-        if any(name in command_list for name in cmd_names):
+        if command_name in command_set:
             return True
 
         await ctx.send(
@@ -74,7 +56,7 @@ async def global_channel_check(ctx: commands.Context) -> bool:
 
 
     if cmd_mode == "exclude":
-        if any(name in command_list for name in cmd_names):
+        if command_name in command_set:
             await ctx.send(
                 embed=discord.Embed(
                     title="🚫 Command blocked in this channel",
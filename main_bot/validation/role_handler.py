@@ -4,9 +4,17 @@ from discord.ext import commands
 
 def role_validation():
     async def check_permissions(wrapped_ctx: commands.Context):
-        member = [i for i in list(wrapped_ctx.args)if isinstance(i, discord.Member)]
+        author = wrapped_ctx.author
+        guild = wrapped_ctx.guild
+        index = wrapped_ctx.bot.role_index.for_guild(guild) if guild else None
 
-        if not any("Moderator" in r.name for r in wrapped_ctx.author.roles):
+        is_moderator = False
+        if index is not None:
+            config = await wrapped_ctx.bot.config_cache.get(guild.id)
+            moderator_ids = index.moderator_ids(config.moderator_roles if config else None)
+            is_moderator = any(author.get_role(role_id) is not None for role_id in moderator_ids)
+
+        if not is_moderator:
             await wrapped_ctx.send(
                 embed=discord.Embed(
                     title="❌ Permission Denied",
@@ -15,22 +23,23 @@ def role_validation():
                 )
             )
             return False
-        requester_top = wrapped_ctx.author.top_role
-
-        members = list(wrapped_ctx.message.mentions)
-        members += [i for i in member if i not in members]
-        if members:
-            for m in members:
-                target_top = m.top_role
-                if requester_top.position <= target_top.position:
-                    await wrapped_ctx.send(
-                        embed=discord.Embed(
-                            title="❌ Permission Denied",
-                            description=f"You cannot modify roles of user `{m.display_name}` with equal/higher roles.",
-                            color=discord.Color.red()
-                        )
+        requester_top = index.top_position(author)
+
+        members = {m.id: m for m in wrapped_ctx.message.mentions if isinstance(m, discord.Member)}
+        for arg in wrapped_ctx.args:
+            if isinstance(arg, discord.Member):
+                members.setdefault(arg.id, arg)
+
+        for m in members.values():
+            if requester_top <= index.top_position(m):
+                await wrapped_ctx.send(
+                    embed=discord.Embed(
+                        title="❌ Permission Denied",
+                        description=f"You cannot modify roles of user `{m.display_name}` with equal/higher roles.",
+                        color=discord.Color.red()
                     )
-                    return False
+                )
+                return False
 
         return True
     return commands.check(check_permissions)
@@ -43,17 +52,11 @@ async def resolve_roles(ctx, raw_params: list[str]) -> list[discord.Role]:
     string_params = list(filter(lambda x: isinstance(x, str), original_params))
     mentioned_roles = list(ctx.message.role_mentions)
 
-    name_map = {}
-    for r in ctx.guild.roles:
-        normalized_name = r.name.lower()
-        name_map[normalized_name] = r
+    index = ctx.bot.role_index.for_guild(ctx.guild)
 
     mentioned_roles += [r for r in role_params if r not in mentioned_roles]
     for query in string_params:
-        q = query.lower()
-        matches = [name for name in name_map.keys() if name.startswith(q)]
-        for match in matches:
-            r = name_map[match]
+        for r in index.prefix(query):
             if r not in mentioned_roles:
                 mentioned_roles.append(r)
 
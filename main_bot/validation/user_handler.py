@@ -1,7 +1,35 @@
+import re
 import discord
+from discord.ext import commands
 
+_MENTION_OR_ID = re.compile(r"<@!?([0-9]{15,20})>$|([0-9]{15,20})$")
 
-import discord
+
+class IndexedMember(commands.Converter):
+    """
+    Member converter backed by the bot's member name index.
+
+    Resolves mentions/IDs from the member cache and names through an exact
+    index lookup, so it never scans `guild.members`. Raises MemberNotFound
+    so `IndexedMember | str` falls back to the raw string like
+    `discord.Member | str` does.
+    """
+
+    async def convert(self, ctx: commands.Context, argument: str) -> discord.Member:
+        if ctx.guild is None:
+            raise commands.NoPrivateMessage()
+
+        match = _MENTION_OR_ID.match(argument)
+        if match:
+            member = ctx.guild.get_member(int(match.group(1) or match.group(2)))
+            if member is not None:
+                return member
+            raise commands.MemberNotFound(argument)
+
+        found = ctx.bot.member_index.for_guild(ctx.guild).exact(argument)
+        if found:
+            return found[0]
+        raise commands.MemberNotFound(argument)
 
 
 async def resolve_members(ctx, raw_params: list[str]) -> list[discord.Member]:
@@ -12,20 +40,11 @@ async def resolve_members(ctx, raw_params: list[str]) -> list[discord.Member]:
     string_params = list(filter(lambda x: isinstance(x, str), original_params))
     mentioned_members = list(ctx.message.mentions)
 
-    name_map = {}
-    for m in ctx.guild.members:
-        normalized_name = m.name.lower()
-        normalized_display = m.display_name.lower()
-        name_map[normalized_name] = m
-        name_map[normalized_display] = m
-
     if "@here" not in string_params:
+        index = ctx.bot.member_index.for_guild(ctx.guild)
         mentioned_members += [m for m in user_params if m not in mentioned_members]
         for query in string_params:
-            q = query.lower()
-            matches = [name for name in name_map.keys() if name.startswith(q)]
-            for match in matches:
-                m = name_map[match]
+            for m in index.prefix(query):
                 if m not in mentioned_members and not m.bot:
                     mentioned_members.append(m)
 
@@ -33,11 +52,11 @@ async def resolve_members(ctx, raw_params: list[str]) -> list[discord.Member]:
         if isinstance(ctx.channel, discord.Thread):
             members = await ctx.channel.fetch_members()
             for partial in members:
-                m = discord.utils.get(ctx.guild.members, id=partial.id)
+                m = ctx.guild.get_member(partial.id)
                 if m and not m.bot and m not in mentioned_members:
                     mentioned_members.append(m)
         else:
             await ctx.send("`@here` cannot be used here")
             return None
 
-    return mentioned_members
\ No newline at end of file
+    return mentioned_members